@@ -1,22 +1,44 @@
 # dashboard-website/app.py
 import os
+import atexit
+import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from functools import wraps
+from functools import lru_cache, wraps
+from zoneinfo import ZoneInfo
 
-import pytz
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, abort
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import (Flask, Response, render_template, request,
+                   redirect, url_for, session, flash, jsonify, abort)
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from werkzeug.utils import secure_filename
-import psycopg
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, class_row, namedtuple_row, tuple_row
+from psycopg_pool import ConnectionPool
 from dotenv import load_dotenv
 
+from config.settings import normalize_database_url
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # orjson is a speedup; stdlib json has the same loads/dumps API
+    import json as orjson
+    HAS_ORJSON = False
+
 # Load environment variables
 load_dotenv()
 
@@ -25,27 +47,97 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # Timezone setup
-IST = pytz.timezone('Asia/Kolkata')
+IST = ZoneInfo('Asia/Kolkata')
+UTC = timezone.utc
 
 def ist_now():
     """Get current time in IST"""
-    utc_now = datetime.now(pytz.utc)
-    return utc_now.astimezone(IST)
+    return datetime.now(IST)
+
+IST_DATETIME_FORMAT = "%d %b %Y, %I:%M %p"
+
+@lru_cache(maxsize=4096)
+def _format_ist(dt, format_str):
+    """Format an aware datetime in IST"""
+    if dt.tzinfo is not IST:
+        dt = dt.astimezone(IST)
+    return dt.strftime(format_str)
 
-def format_ist_datetime(dt, format_str="%d %b %Y, %I:%M %p"):
+def format_ist_datetime(dt, format_str=IST_DATETIME_FORMAT):
     """Format datetime in IST"""
     if dt is None:
         return ""
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
-    return dt.astimezone(IST).strftime(format_str)
+        dt = dt.replace(tzinfo=UTC)
+    return _format_ist(dt, format_str)
+
+def json_response(payload, status=200):
+    """Serialize payload with orjson into a JSON response"""
+    body = payload if isinstance(payload, (bytes, str)) else orjson.dumps(payload)
+    return Response(body, status=status, mimetype='application/json')
+
+def loads_json(s):
+    """Parse stored JSON; legacy rows orjson rejects (NaN, huge numbers, ...) fall back to json.loads"""
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        return json.loads(s)
+
+def conditional_json_response(body, max_age):
+    """JSON response with an ETag of the body, answering 304 when the client copy matches"""
+    raw = body.encode() if isinstance(body, str) else body
+    response = json_response(raw)
+    response.set_etag(hashlib.blake2b(raw, digest_size=8).hexdigest(), weak=True)
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify() backed by orjson, keeping Flask's default output format"""
+    
+    def _orjson_options(self):
+        """orjson options matching DefaultJSONProvider output"""
+        # Non-str keys are coerced as json.dumps does; dates go through self.default so
+        # they keep Flask's RFC 822 format; Decimal and other extras use the same hook
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+    
+    def dumps(self, obj, **kwargs):
+        # Formatting options orjson can't express (custom separators, ...) use the stdlib path
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._orjson_options()).decode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # jsonify() and dict returns land here; the base class would pass separators/indent
+        # to dumps(), so encode directly: orjson output is already compact, indent mirrors debug
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._orjson_options()
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        body = orjson.dumps(obj, default=self.default, option=option)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
 
 # Initialize Flask app
 app = Flask(__name__)
+if HAS_ORJSON:
+    app.json = ORJSONProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'admin-dashboard-secret-key-change-me')
 app.config['SESSION_TYPE'] = 'filesystem'
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=24)
 
+# In-process cache for short-lived dashboard aggregates. Each worker has its own copy,
+# so entries are never invalidated explicitly; readers accept up to one timeout of staleness.
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 30))  # seconds
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': DASHBOARD_CACHE_TIMEOUT})
+
 # Cloudinary configuration
 cloudinary.config(
     cloud_name=os.environ.get("CLOUDINARY_CLOUD_NAME"),
@@ -55,22 +147,262 @@ cloudinary.config(
 )
 
 # Database connection
+def get_database_url():
+    """Get normalized database URL from environment"""
+    return normalize_database_url(os.environ.get('DATABASE_URL'))
+
+def configure_db_connection(conn):
+    """Prepare statements server-side from their first execution"""
+    conn.prepare_threshold = 1
+
+# Process-wide connection pool (one per gunicorn worker)
+db_pool = ConnectionPool(
+    get_database_url(),
+    min_size=int(os.environ.get('DB_POOL_MIN_SIZE', 4)),
+    max_size=int(os.environ.get('DB_POOL_MAX_SIZE', 20)),
+    kwargs={'row_factory': dict_row},
+    configure=configure_db_connection,
+    open=False
+)
+db_pool.open()
+atexit.register(db_pool.close)
+
 def get_db_connection():
-    """Establish database connection"""
-    database_url = os.environ.get('DATABASE_URL')
-    
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is not set")
-    
-    if database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql://', 1)
-    
-    try:
-        conn = psycopg.connect(database_url, row_factory=dict_row)
-        return conn
-    except Exception as e:
-        logger.error(f"Database connection error: {e}")
-        raise
+    """Borrow a pooled connection; it is returned to the pool when the with-block exits"""
+    # Every caller uses `with`, so no per-request teardown hook is needed to return connections
+    return db_pool.connection()
+
+# Database schema, applied by init_database() as one multi-statement script
+SCHEMA_SQL = """
+-- Create users table
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    profile_pic VARCHAR(255),
+    full_name VARCHAR(100) NOT NULL,
+    phone VARCHAR(15) UNIQUE NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    location TEXT NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_login TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE
+);
+
+-- Create services table
+CREATE TABLE IF NOT EXISTS services (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    photo VARCHAR(500),
+    price DECIMAL(10, 2) NOT NULL,
+    discount DECIMAL(10, 2) DEFAULT 0,
+    final_price DECIMAL(10, 2) NOT NULL,
+    description TEXT,
+    category VARCHAR(50),
+    status VARCHAR(20) DEFAULT 'active',
+    position INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    cloudinary_id VARCHAR(255),
+    photo_upload_error TEXT
+);
+
+-- Last background photo upload failure (NULL once a photo is in place)
+ALTER TABLE services ADD COLUMN IF NOT EXISTS photo_upload_error TEXT;
+
+-- Create menu table
+CREATE TABLE IF NOT EXISTS menu (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    photo VARCHAR(500),
+    price DECIMAL(10, 2) NOT NULL,
+    discount DECIMAL(10, 2) DEFAULT 0,
+    final_price DECIMAL(10, 2) NOT NULL,
+    description TEXT,
+    category VARCHAR(50),
+    status VARCHAR(20) DEFAULT 'active',
+    position INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    cloudinary_id VARCHAR(255)
+);
+
+-- Create cart table
+CREATE TABLE IF NOT EXISTS cart (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    item_type VARCHAR(10) CHECK (item_type IN ('service', 'menu')),
+    item_id INTEGER NOT NULL,
+    quantity INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, item_type, item_id)
+);
+
+-- Create orders table
+CREATE TABLE IF NOT EXISTS orders (
+    order_id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    user_name VARCHAR(100),
+    user_email VARCHAR(100),
+    user_phone VARCHAR(15),
+    user_address TEXT,
+    items TEXT NOT NULL,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    payment_mode VARCHAR(20) NOT NULL,
+    delivery_location TEXT NOT NULL,
+    order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status VARCHAR(20) DEFAULT 'pending',
+    delivery_date TIMESTAMP,
+    notes TEXT
+);
+
+-- Item count of an order's items JSON (0 when missing or malformed)
+CREATE OR REPLACE FUNCTION order_item_count(items TEXT)
+RETURNS INTEGER AS $$
+BEGIN
+    IF jsonb_typeof(items::jsonb) = 'array' THEN
+        RETURN jsonb_array_length(items::jsonb);
+    END IF;
+    RETURN 0;
+EXCEPTION WHEN others THEN
+    RETURN 0;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Create order_items table
+CREATE TABLE IF NOT EXISTS order_items (
+    order_item_id SERIAL PRIMARY KEY,
+    order_id INTEGER REFERENCES orders(order_id) ON DELETE CASCADE,
+    item_type VARCHAR(10) CHECK (item_type IN ('service', 'menu')),
+    item_id INTEGER NOT NULL,
+    item_name VARCHAR(100),
+    item_photo VARCHAR(500),
+    item_description TEXT,
+    quantity INTEGER NOT NULL,
+    price DECIMAL(10, 2) NOT NULL,
+    total DECIMAL(10, 2) NOT NULL
+);
+
+-- Create payments table
+CREATE TABLE IF NOT EXISTS payments (
+    payment_id SERIAL PRIMARY KEY,
+    order_id INTEGER REFERENCES orders(order_id) ON DELETE CASCADE,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    amount DECIMAL(10, 2) NOT NULL,
+    payment_mode VARCHAR(20) NOT NULL,
+    transaction_id VARCHAR(100),
+    payment_status VARCHAR(20) DEFAULT 'pending',
+    payment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    razorpay_order_id VARCHAR(100),
+    razorpay_payment_id VARCHAR(100),
+    razorpay_signature VARCHAR(200)
+);
+
+-- Create addresses table WITH google_maps_link
+CREATE TABLE IF NOT EXISTS addresses (
+    address_id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    full_name VARCHAR(100) NOT NULL,
+    phone VARCHAR(15) NOT NULL,
+    address_line1 TEXT NOT NULL,
+    address_line2 TEXT,
+    landmark VARCHAR(100),
+    city VARCHAR(50) NOT NULL,
+    state VARCHAR(50) NOT NULL,
+    pincode VARCHAR(10) NOT NULL,
+    latitude DECIMAL(10, 8),
+    longitude DECIMAL(11, 8),
+    google_maps_link TEXT,
+    is_default BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create reviews table
+CREATE TABLE IF NOT EXISTS reviews (
+    review_id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    order_id INTEGER REFERENCES orders(order_id) ON DELETE CASCADE,
+    item_type VARCHAR(10) CHECK (item_type IN ('service', 'menu')),
+    item_id INTEGER NOT NULL,
+    rating INTEGER CHECK (rating >= 1 AND rating <= 5),
+    comment TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_approved BOOLEAN DEFAULT FALSE
+);
+
+-- Create notifications table
+CREATE TABLE IF NOT EXISTS notifications (
+    notification_id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    title VARCHAR(100) NOT NULL,
+    message TEXT NOT NULL,
+    notification_type VARCHAR(20),
+    is_read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    read_at TIMESTAMP
+);
+
+-- Archive for read notifications moved out by cleanup_old_data
+CREATE TABLE IF NOT EXISTS notifications_archive (LIKE notifications);
+
+-- Create admin users table if not exists
+CREATE TABLE IF NOT EXISTS admin_users (
+    admin_id SERIAL PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100),
+    role VARCHAR(20) DEFAULT 'admin',
+    is_active BOOLEAN DEFAULT TRUE,
+    last_login TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for hot dashboard/orders queries
+CREATE INDEX IF NOT EXISTS idx_orders_date_desc ON orders(order_date DESC, order_id DESC);
+CREATE INDEX IF NOT EXISTS idx_orders_status_date ON orders(status, order_date DESC, order_id DESC);
+CREATE INDEX IF NOT EXISTS idx_orders_user_date ON orders(user_id, order_date DESC) INCLUDE (total_amount, status);
+DROP INDEX IF EXISTS idx_orders_user;
+CREATE INDEX IF NOT EXISTS idx_payments_order_date ON payments(order_id, payment_date DESC);
+CREATE INDEX IF NOT EXISTS idx_payments_status ON payments(payment_status) WHERE payment_status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_order_items_type_id ON order_items(item_type, item_id);
+CREATE INDEX IF NOT EXISTS idx_users_active ON users(is_active) WHERE is_active = TRUE;
+CREATE INDEX IF NOT EXISTS idx_users_created_id ON users(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_orders_date_covering ON orders(order_date) INCLUDE (status, payment_mode, total_amount);
+CREATE INDEX IF NOT EXISTS idx_payments_status_date ON payments(payment_status, payment_date DESC);
+CREATE INDEX IF NOT EXISTS idx_reviews_approved_date ON reviews(is_approved, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_payments_date_id ON payments(payment_date DESC, payment_id DESC);
+CREATE INDEX IF NOT EXISTS idx_reviews_created_id ON reviews(created_at DESC, review_id DESC);
+CREATE INDEX IF NOT EXISTS idx_addresses_created_id ON addresses(created_at DESC, address_id DESC);
+CREATE INDEX IF NOT EXISTS idx_notifications_read_created ON notifications(created_at) WHERE is_read = TRUE;
+
+-- Precomputed per-day (IST) order aggregates for revenue charts
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_orders_daily AS
+SELECT 
+    DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata') as order_day,
+    COUNT(*) as order_count,
+    COALESCE(SUM(total_amount), 0) as revenue
+FROM orders
+GROUP BY DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata');
+
+-- Unique index is required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_orders_daily_day ON mv_orders_daily(order_day);
+
+-- Per-day (IST) order aggregates by status and payment mode for the stats API
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_orders_daily_breakdown AS
+SELECT 
+    DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata') as order_day,
+    status,
+    payment_mode,
+    COUNT(*) as order_count,
+    COALESCE(SUM(total_amount), 0) as amount
+FROM orders
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_orders_daily_breakdown_key ON mv_orders_daily_breakdown(order_day, status, payment_mode);
+
+-- Earlier schema pre-joined payments for the list; it now joins the live tables
+DROP MATERIALIZED VIEW IF EXISTS mv_payments_flat;
+"""
 
 def init_database():
     """Initialize database tables if they don't exist"""
@@ -79,266 +411,128 @@ def init_database():
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Create users table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS users (
-                        id SERIAL PRIMARY KEY,
-                        profile_pic VARCHAR(255),
-                        full_name VARCHAR(100) NOT NULL,
-                        phone VARCHAR(15) UNIQUE NOT NULL,
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        location TEXT NOT NULL,
-                        password VARCHAR(255) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        last_login TIMESTAMP,
-                        is_active BOOLEAN DEFAULT TRUE
-                    )
-                """)
-                logger.info("✅ Table 'users' created successfully")
-                
-                # Create services table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS services (
-                        id SERIAL PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL,
-                        photo VARCHAR(500),
-                        price DECIMAL(10, 2) NOT NULL,
-                        discount DECIMAL(10, 2) DEFAULT 0,
-                        final_price DECIMAL(10, 2) NOT NULL,
-                        description TEXT,
-                        category VARCHAR(50),
-                        status VARCHAR(20) DEFAULT 'active',
-                        position INTEGER DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        cloudinary_id VARCHAR(255)
-                    )
-                """)
-                logger.info("✅ Table 'services' created successfully")
-                
-                # Create menu table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS menu (
-                        id SERIAL PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL,
-                        photo VARCHAR(500),
-                        price DECIMAL(10, 2) NOT NULL,
-                        discount DECIMAL(10, 2) DEFAULT 0,
-                        final_price DECIMAL(10, 2) NOT NULL,
-                        description TEXT,
-                        category VARCHAR(50),
-                        status VARCHAR(20) DEFAULT 'active',
-                        position INTEGER DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        cloudinary_id VARCHAR(255)
-                    )
-                """)
-                logger.info("✅ Table 'menu' created successfully")
-                
-                # Create cart table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS cart (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        item_type VARCHAR(10) CHECK (item_type IN ('service', 'menu')),
-                        item_id INTEGER NOT NULL,
-                        quantity INTEGER DEFAULT 1,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, item_type, item_id)
-                    )
-                """)
-                logger.info("✅ Table 'cart' created successfully")
-                
-                # Create orders table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS orders (
-                        order_id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        user_name VARCHAR(100),
-                        user_email VARCHAR(100),
-                        user_phone VARCHAR(15),
-                        user_address TEXT,
-                        items TEXT NOT NULL,
-                        total_amount DECIMAL(10, 2) NOT NULL,
-                        payment_mode VARCHAR(20) NOT NULL,
-                        delivery_location TEXT NOT NULL,
-                        order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        status VARCHAR(20) DEFAULT 'pending',
-                        delivery_date TIMESTAMP,
-                        notes TEXT
-                    )
-                """)
-                logger.info("✅ Table 'orders' created successfully")
-                
-                # Create order_items table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS order_items (
-                        order_item_id SERIAL PRIMARY KEY,
-                        order_id INTEGER REFERENCES orders(order_id) ON DELETE CASCADE,
-                        item_type VARCHAR(10) CHECK (item_type IN ('service', 'menu')),
-                        item_id INTEGER NOT NULL,
-                        item_name VARCHAR(100),
-                        item_photo VARCHAR(500),
-                        item_description TEXT,
-                        quantity INTEGER NOT NULL,
-                        price DECIMAL(10, 2) NOT NULL,
-                        total DECIMAL(10, 2) NOT NULL
-                    )
-                """)
-                logger.info("✅ Table 'order_items' created successfully")
-                
-                # Create payments table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS payments (
-                        payment_id SERIAL PRIMARY KEY,
-                        order_id INTEGER REFERENCES orders(order_id) ON DELETE CASCADE,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        amount DECIMAL(10, 2) NOT NULL,
-                        payment_mode VARCHAR(20) NOT NULL,
-                        transaction_id VARCHAR(100),
-                        payment_status VARCHAR(20) DEFAULT 'pending',
-                        payment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        razorpay_order_id VARCHAR(100),
-                        razorpay_payment_id VARCHAR(100),
-                        razorpay_signature VARCHAR(200)
-                    )
-                """)
-                logger.info("✅ Table 'payments' created successfully")
-                
-                # Create addresses table WITH google_maps_link
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS addresses (
-                        address_id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        full_name VARCHAR(100) NOT NULL,
-                        phone VARCHAR(15) NOT NULL,
-                        address_line1 TEXT NOT NULL,
-                        address_line2 TEXT,
-                        landmark VARCHAR(100),
-                        city VARCHAR(50) NOT NULL,
-                        state VARCHAR(50) NOT NULL,
-                        pincode VARCHAR(10) NOT NULL,
-                        latitude DECIMAL(10, 8),
-                        longitude DECIMAL(11, 8),
-                        google_maps_link TEXT,
-                        is_default BOOLEAN DEFAULT FALSE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                logger.info("✅ Table 'addresses' created successfully")
-                
-                # Create reviews table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS reviews (
-                        review_id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        order_id INTEGER REFERENCES orders(order_id) ON DELETE CASCADE,
-                        item_type VARCHAR(10) CHECK (item_type IN ('service', 'menu')),
-                        item_id INTEGER NOT NULL,
-                        rating INTEGER CHECK (rating >= 1 AND rating <= 5),
-                        comment TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        is_approved BOOLEAN DEFAULT FALSE
-                    )
-                """)
-                logger.info("✅ Table 'reviews' created successfully")
+                # Ship the whole schema in a single round-trip (simple query protocol)
+                cur.execute(SCHEMA_SQL, prepare=False)
+                logger.info("✅ Tables, indexes and views created successfully")
                 
-                # Create notifications table
+                # Create default admin unless it already exists
                 cur.execute("""
-                    CREATE TABLE IF NOT EXISTS notifications (
-                        notification_id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        title VARCHAR(100) NOT NULL,
-                        message TEXT NOT NULL,
-                        notification_type VARCHAR(20),
-                        is_read BOOLEAN DEFAULT FALSE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        read_at TIMESTAMP
-                    )
-                """)
-                logger.info("✅ Table 'notifications' created successfully")
-                
-                # Create admin users table if not exists
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS admin_users (
-                        admin_id SERIAL PRIMARY KEY,
-                        username VARCHAR(50) UNIQUE NOT NULL,
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        password VARCHAR(255) NOT NULL,
-                        full_name VARCHAR(100),
-                        role VARCHAR(20) DEFAULT 'admin',
-                        is_active BOOLEAN DEFAULT TRUE,
-                        last_login TIMESTAMP,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                logger.info("✅ Table 'admin_users' created successfully")
-                
-                # Check if default admin exists, if not create one
-                cur.execute("SELECT * FROM admin_users WHERE username = 'admin'")
-                if not cur.fetchone():
-                    hashed_password = generate_password_hash('admin123')
-                    cur.execute("""
-                        INSERT INTO admin_users (username, email, password, full_name, role)
-                        VALUES (%s, %s, %s, %s, %s)
-                    """, ('admin', 'admin@bitebuddydashboard.com', hashed_password, 'Administrator', 'superadmin'))
+                    INSERT INTO admin_users (username, email, password, full_name, role)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT DO NOTHING
+                """, ('admin', 'admin@bitebuddydashboard.com', hash_admin_password('admin123'), 'Administrator', 'superadmin'))
+                if cur.rowcount:
                     logger.info("✅ Default admin user created successfully")
                 
                 conn.commit()
                 logger.info("🎉 All database tables initialized successfully")
                 
     except Exception as e:
-        logger.error(f"❌ Database initialization failed: {e}")
+        logger.error("❌ Database initialization failed: %s", e)
         raise
 
-# Initialize database on startup
-init_database()
+# Typed rows for hot list queries
+@dataclass(slots=True)
+class OrderListRow:
+    """Row shape of the orders list query"""
+    order_id: int
+    user_id: int
+    user_name: str
+    user_address: str
+    total_amount: Decimal
+    payment_mode: str
+    delivery_location: str
+    order_date: datetime
+    status: str
+    delivery_date: datetime
+    notes: str
+    item_count: int
+    order_date_formatted: str
+    delivery_date_formatted: str
+    user_phone: str
+    user_email: str
+    payment_status: str
+    actual_payment_mode: str
+    total_count: int
 
 # Helper functions
-def generate_google_maps_link(latitude, longitude):
-    """Generate Google Maps link from latitude and longitude"""
-    if latitude and longitude:
-        return f"https://www.google.com/maps?q={latitude},{longitude}"
-    return None
-
 def update_address_maps_links():
     """Update existing addresses with Google Maps links"""
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Get addresses without maps links
+                # Build the links server-side in a single statement
                 cur.execute("""
-                    SELECT address_id, latitude, longitude 
-                    FROM addresses 
+                    UPDATE addresses 
+                    SET google_maps_link = 'https://www.google.com/maps?q=' || latitude || ',' || longitude 
                     WHERE google_maps_link IS NULL 
-                    AND latitude IS NOT NULL 
-                    AND longitude IS NOT NULL
+                    AND latitude IS NOT NULL AND latitude != 0 
+                    AND longitude IS NOT NULL AND longitude != 0
                 """)
+                updated_count = cur.rowcount
                 
-                addresses = cur.fetchall()
-                
-                for address in addresses:
-                    maps_link = generate_google_maps_link(
-                        address['latitude'], 
-                        address['longitude']
-                    )
-                    
-                    if maps_link:
-                        cur.execute("""
-                            UPDATE addresses 
-                            SET google_maps_link = %s 
-                            WHERE address_id = %s
-                        """, (maps_link, address['address_id']))
+                conn.commit()
+                logger.info("✅ Updated %s addresses with Google Maps links", updated_count)
                 
+    except Exception as e:
+        logger.error("Error updating maps links: %s", e)
+
+def run_migrations():
+    """Create schema objects and backfill data (run once per release, not per worker)"""
+    init_database()
+    update_address_maps_links()
+
+# Materialized views refreshed out-of-band (see refresh-views command)
+MATERIALIZED_VIEWS = ('mv_orders_daily', 'mv_orders_daily_breakdown')
+
+def refresh_materialized_views():
+    """Refresh precomputed aggregate views without blocking readers"""
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                for view in MATERIALIZED_VIEWS:
+                    cur.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
                 conn.commit()
-                logger.info(f"✅ Updated {len(addresses)} addresses with Google Maps links")
+                logger.info("✅ Refreshed materialized views: %s", ', '.join(MATERIALIZED_VIEWS))
                 
     except Exception as e:
-        logger.error(f"Error updating maps links: {e}")
+        logger.error("Error refreshing materialized views: %s", e)
+        raise
+
+@app.cli.command('db-init')
+def db_init_command():
+    """Initialize database tables, indexes and address links"""
+    run_migrations()
 
-# Run once on startup
-update_address_maps_links()
+@app.cli.command('refresh-views')
+def refresh_views_command():
+    """Refresh materialized views backing the revenue charts and stats API"""
+    refresh_materialized_views()
+
+# Password hashing: argon2 for new hashes, legacy Werkzeug PBKDF2 hashes still verify
+ARGON2_PREFIX = '$argon2'
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+def hash_admin_password(password):
+    """Hash a password for storage"""
+    return password_hasher.hash(password)
+
+def verify_admin_password(password_hash, password):
+    """Verify password against an argon2 or legacy Werkzeug hash"""
+    if not password_hash.startswith(ARGON2_PREFIX):
+        return check_password_hash(password_hash, password)
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def admin_password_needs_rehash(password_hash):
+    """Check whether a stored hash should be upgraded to current argon2 parameters"""
+    return not password_hash.startswith(ARGON2_PREFIX) or password_hasher.check_needs_rehash(password_hash)
+
+# Migrations only run at import when explicitly requested
+if os.environ.get('RUN_MIGRATIONS') == '1':
+    run_migrations()
 
 # Authentication decorator
 def admin_login_required(f):
@@ -370,19 +564,16 @@ def admin_login():
         try:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT * FROM admin_users WHERE username = %s AND is_active = TRUE",
-                        (username,)
-                    )
+                    # Fetch admin and stamp last login in one round-trip;
+                    # rolled back below if the password does not match
+                    cur.execute("""
+                        UPDATE admin_users SET last_login = CURRENT_TIMESTAMP 
+                        WHERE username = %s AND is_active = TRUE
+                        RETURNING admin_id, username, password, full_name, role, email
+                    """, (username,))
                     admin = cur.fetchone()
                     
-                    if admin and check_password_hash(admin['password'], password):
-                        # Update last login
-                        cur.execute(
-                            "UPDATE admin_users SET last_login = CURRENT_TIMESTAMP WHERE admin_id = %s",
-                            (admin['admin_id'],)
-                        )
-                        
+                    if admin and verify_admin_password(admin['password'], password):
                         # Set session
                         session['admin_id'] = admin['admin_id']
                         session['username'] = admin['username']
@@ -390,18 +581,26 @@ def admin_login():
                         session['role'] = admin['role']
                         session['email'] = admin['email']
                         
+                        # Upgrade legacy PBKDF2 hashes to argon2 on successful login
+                        if admin_password_needs_rehash(admin['password']):
+                            cur.execute(
+                                "UPDATE admin_users SET password = %s WHERE admin_id = %s",
+                                (hash_admin_password(password), admin['admin_id'])
+                            )
+                        
                         conn.commit()
                         
                         flash('Login successful!', 'success')
-                        logger.info(f"Admin '{username}' logged in")
+                        logger.info("Admin '%s' logged in", username)
                         return redirect(url_for('dashboard'))
                     else:
+                        conn.rollback()
                         flash('Invalid username or password', 'error')
                         return render_template('admin_login.html')
                         
         except Exception as e:
-            flash(f'Login failed: {str(e)}', 'error')
-            logger.error(f"Login error: {e}")
+            flash('Login failed', 'error')
+            logger.error("Login error: %s", e)
             return render_template('admin_login.html')
     
     return render_template('admin_login.html')
@@ -409,178 +608,171 @@ def admin_login():
 @app.route('/admin/logout')
 def admin_logout():
     if 'admin_id' in session:
-        logger.info(f"Admin '{session.get('username')}' logged out")
+        logger.info("Admin '%s' logged out", session.get('username'))
         session.clear()
     flash('Logged out successfully', 'success')
     return redirect(url_for('admin_login'))
 
 # Dashboard routes
-@app.route('/dashboard')
-@admin_login_required
-def dashboard():
-    try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Total orders count
-                cur.execute("SELECT COUNT(*) as total_orders FROM orders")
-                total_orders = cur.fetchone()['total_orders']
-                
-                # Orders by status
-                cur.execute("""
-                    SELECT status, COUNT(*) as count 
+DASHBOARD_CACHE_KEY = 'dashboard_stats'
+
+@cache.cached(timeout=DASHBOARD_CACHE_TIMEOUT, key_prefix=DASHBOARD_CACHE_KEY)
+def get_dashboard_stats():
+    """Compute dashboard widget data (cached briefly across page views)"""
+    # Today's orders (IST date)
+    today_start = ist_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = today_start + timedelta(days=1)
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            # All dashboard widgets in a single round-trip
+            cur.execute("""
+                WITH totals AS (
+                    SELECT 
+                        COUNT(*) as total_orders,
+                        COALESCE(SUM(total_amount) FILTER (WHERE status != 'cancelled'), 0) as total_revenue,
+                        COUNT(*) FILTER (WHERE order_date >= %(today_start)s AND order_date < %(today_end)s) as today_orders,
+                        COALESCE(SUM(total_amount) FILTER (WHERE order_date >= %(today_start)s AND order_date < %(today_end)s), 0) as today_revenue
+                    FROM orders
+                ),
+                status_counts AS (
+                    SELECT COALESCE(status, 'unknown') as status, COUNT(*) as count 
                     FROM orders 
                     GROUP BY status
-                """)
-                status_counts = {row['status']: row['count'] for row in cur.fetchall()}
-                
-                # Today's orders (IST date)
-                today_start = ist_now().replace(hour=0, minute=0, second=0, microsecond=0)
-                today_end = today_start + timedelta(days=1)
-                
-                cur.execute("""
-                    SELECT COUNT(*) as today_orders, 
-                           COALESCE(SUM(total_amount), 0) as today_revenue
-                    FROM orders 
-                    WHERE order_date >= %s AND order_date < %s
-                """, (today_start.astimezone(pytz.utc), today_end.astimezone(pytz.utc)))
-                today_data = cur.fetchone()
-                
-                # Total revenue
-                cur.execute("""
-                    SELECT COALESCE(SUM(total_amount), 0) as total_revenue 
-                    FROM orders 
-                    WHERE status != 'cancelled'
-                """)
-                total_revenue = cur.fetchone()['total_revenue']
-                
-                # Active users count
-                cur.execute("SELECT COUNT(*) as active_users FROM users WHERE is_active = TRUE")
-                active_users = cur.fetchone()['active_users']
-                
-                # Pending payments
-                cur.execute("""
-                    SELECT COUNT(*) as pending_payments 
-                    FROM payments 
-                    WHERE payment_status = 'pending'
-                """)
-                pending_payments = cur.fetchone()['pending_payments']
-                
-                # Latest orders (last 10)
-                cur.execute("""
+                ),
+                latest AS (
                     SELECT 
                         o.order_id,
                         o.user_name,
                         o.total_amount,
                         o.status,
                         o.order_date,
+                        TO_CHAR(o.order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as order_date_formatted,
                         o.payment_mode,
                         u.phone as user_phone
                     FROM orders o
                     LEFT JOIN users u ON o.user_id = u.id
                     ORDER BY o.order_date DESC
                     LIMIT 10
-                """)
-                latest_orders = cur.fetchall()
-                
-                # Format dates for display
-                for order in latest_orders:
-                    order['order_date_formatted'] = format_ist_datetime(order['order_date'])
-                
-                # Top selling services
-                cur.execute("""
-                    SELECT 
-                        s.name,
-                        COUNT(oi.order_item_id) as sales_count,
-                        SUM(oi.quantity) as total_quantity,
-                        SUM(oi.total) as total_revenue
-                    FROM order_items oi
-                    JOIN services s ON oi.item_id = s.id AND oi.item_type = 'service'
-                    GROUP BY s.id, s.name
-                    ORDER BY total_revenue DESC
-                    LIMIT 5
-                """)
-                top_services = cur.fetchall()
-                
-                # Top selling menu items
-                cur.execute("""
+                ),
+                top_items AS (
                     SELECT 
-                        m.name,
+                        oi.item_type,
+                        COALESCE(s.name, m.name) as name,
                         COUNT(oi.order_item_id) as sales_count,
                         SUM(oi.quantity) as total_quantity,
-                        SUM(oi.total) as total_revenue
+                        SUM(oi.total) as total_revenue,
+                        ROW_NUMBER() OVER (PARTITION BY oi.item_type ORDER BY SUM(oi.total) DESC) as rank
                     FROM order_items oi
-                    JOIN menu m ON oi.item_id = m.id AND oi.item_type = 'menu'
-                    GROUP BY m.id, m.name
-                    ORDER BY total_revenue DESC
-                    LIMIT 5
-                """)
-                top_menu = cur.fetchall()
-                
-                # Daily revenue for last 7 days
-                cur.execute("""
+                    LEFT JOIN services s ON oi.item_type = 'service' AND oi.item_id = s.id
+                    LEFT JOIN menu m ON oi.item_type = 'menu' AND oi.item_id = m.id
+                    WHERE s.id IS NOT NULL OR m.id IS NOT NULL
+                    GROUP BY oi.item_type, oi.item_id, s.name, m.name
+                ),
+                daily AS (
                     SELECT 
-                        DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata') as order_day,
-                        COUNT(*) as order_count,
-                        COALESCE(SUM(total_amount), 0) as daily_revenue
-                    FROM orders
-                    WHERE order_date >= CURRENT_DATE - INTERVAL '7 days'
-                    GROUP BY DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata')
-                    ORDER BY order_day
-                """)
-                daily_revenue_data = cur.fetchall()
-                
-                # Prepare chart data
-                chart_labels = []
-                chart_revenue = []
-                chart_orders = []
-                
-                for data in daily_revenue_data:
-                    chart_labels.append(data['order_day'].strftime('%b %d'))
-                    chart_revenue.append(float(data['daily_revenue']))
-                    chart_orders.append(data['order_count'])
-                
-                # Monthly revenue
-                cur.execute("""
+                        order_day,
+                        order_count,
+                        revenue as daily_revenue
+                    FROM mv_orders_daily
+                    WHERE order_day >= CURRENT_DATE - 7
+                ),
+                monthly AS (
                     SELECT 
-                        TO_CHAR(order_date, 'Mon YYYY') as month,
-                        COUNT(*) as order_count,
-                        COALESCE(SUM(total_amount), 0) as monthly_revenue
-                    FROM orders
-                    WHERE order_date >= CURRENT_DATE - INTERVAL '6 months'
-                    GROUP BY TO_CHAR(order_date, 'Mon YYYY'), 
-                             DATE_TRUNC('month', order_date)
-                    ORDER BY DATE_TRUNC('month', order_date)
+                        DATE_TRUNC('month', order_day) as month_start,
+                        TO_CHAR(DATE_TRUNC('month', order_day), 'Mon YYYY') as month,
+                        SUM(order_count) as order_count,
+                        SUM(revenue) as monthly_revenue
+                    FROM mv_orders_daily
+                    WHERE order_day >= CURRENT_DATE - INTERVAL '6 months'
+                    GROUP BY DATE_TRUNC('month', order_day)
+                    ORDER BY DATE_TRUNC('month', order_day)
                     LIMIT 6
-                """)
-                monthly_data = cur.fetchall()
-                
-                monthly_labels = []
-                monthly_revenue = []
-                
-                for data in monthly_data:
-                    monthly_labels.append(data['month'])
-                    monthly_revenue.append(float(data['monthly_revenue']))
-        
-        return render_template('dashboard/index.html',
-                           total_orders=total_orders,
-                           status_counts=status_counts,
-                           today_orders=today_data['today_orders'],
-                           today_revenue=float(today_data['today_revenue']),
-                           total_revenue=float(total_revenue),
-                           active_users=active_users,
-                           pending_payments=pending_payments,
-                           latest_orders=latest_orders,
-                           top_services=top_services,
-                           top_menu=top_menu,
-                           chart_labels=chart_labels,
-                           chart_revenue=chart_revenue,
-                           chart_orders=chart_orders,
-                           monthly_labels=monthly_labels,
-                           monthly_revenue=monthly_revenue)
+                )
+                SELECT 
+                    (SELECT row_to_json(t) FROM totals t) as totals,
+                    (SELECT COALESCE(json_object_agg(sc.status, sc.count), '{}') FROM status_counts sc) as status_counts,
+                    (SELECT COUNT(*) FROM users WHERE is_active = TRUE) as active_users,
+                    (SELECT COUNT(*) FROM payments WHERE payment_status = 'pending') as pending_payments,
+                    (SELECT COALESCE(json_agg(l ORDER BY l.order_date DESC), '[]') FROM latest l) as latest_orders,
+                    (SELECT COALESCE(json_agg(json_build_object(
+                        'name', ti.name,
+                        'sales_count', ti.sales_count,
+                        'total_quantity', ti.total_quantity,
+                        'total_revenue', ti.total_revenue
+                    ) ORDER BY ti.rank), '[]') FROM top_items ti WHERE ti.item_type = 'service' AND ti.rank <= 5) as top_services,
+                    (SELECT COALESCE(json_agg(json_build_object(
+                        'name', ti.name,
+                        'sales_count', ti.sales_count,
+                        'total_quantity', ti.total_quantity,
+                        'total_revenue', ti.total_revenue
+                    ) ORDER BY ti.rank), '[]') FROM top_items ti WHERE ti.item_type = 'menu' AND ti.rank <= 5) as top_menu,
+                    (SELECT COALESCE(json_agg(json_build_object(
+                        'label', TO_CHAR(d.order_day, 'Mon DD'),
+                        'order_count', d.order_count,
+                        'daily_revenue', d.daily_revenue
+                    ) ORDER BY d.order_day), '[]') FROM daily d) as daily_revenue,
+                    (SELECT COALESCE(json_agg(mo ORDER BY mo.month_start), '[]') FROM monthly mo) as monthly_revenue
+            """, {
+                'today_start': today_start.astimezone(UTC),
+                'today_end': today_end.astimezone(UTC)
+            })
+            stats = cur.fetchone()
+            
+            totals = stats['totals']
+            total_orders = totals['total_orders']
+            total_revenue = totals['total_revenue']
+            status_counts = stats['status_counts']
+            active_users = stats['active_users']
+            pending_payments = stats['pending_payments']
+            latest_orders = stats['latest_orders']
+            top_services = stats['top_services']
+            top_menu = stats['top_menu']
+            
+            # Prepare chart data
+            chart_labels = []
+            chart_revenue = []
+            chart_orders = []
+            
+            for data in stats['daily_revenue']:
+                chart_labels.append(data['label'])
+                chart_revenue.append(float(data['daily_revenue']))
+                chart_orders.append(data['order_count'])
+            
+            monthly_labels = []
+            monthly_revenue = []
+            
+            for data in stats['monthly_revenue']:
+                monthly_labels.append(data['month'])
+                monthly_revenue.append(float(data['monthly_revenue']))
+    
+    return {
+        'total_orders': total_orders,
+        'status_counts': status_counts,
+        'today_orders': totals['today_orders'],
+        'today_revenue': float(totals['today_revenue']),
+        'total_revenue': float(total_revenue),
+        'active_users': active_users,
+        'pending_payments': pending_payments,
+        'latest_orders': latest_orders,
+        'top_services': top_services,
+        'top_menu': top_menu,
+        'chart_labels': chart_labels,
+        'chart_revenue': chart_revenue,
+        'chart_orders': chart_orders,
+        'monthly_labels': monthly_labels,
+        'monthly_revenue': monthly_revenue
+    }
+
+@app.route('/dashboard')
+@admin_login_required
+def dashboard():
+    try:
+        return render_template('dashboard/index.html', **get_dashboard_stats())
         
     except Exception as e:
-        logger.error(f"Dashboard error: {e}")
-        flash(f'Error loading dashboard: {str(e)}', 'error')
+        logger.error("Dashboard error: %s", e)
+        flash('Error loading dashboard', 'error')
         return render_template('dashboard/index.html',
                            total_orders=0,
                            status_counts={},
@@ -598,86 +790,158 @@ def dashboard():
                            monthly_labels=[],
                            monthly_revenue=[])
 
+# Deepest OFFSET page accepted; past this, clients should follow keyset cursors
+MAX_PAGE = int(os.environ.get('MAX_PAGE', 10000))
+
+def get_page_arg():
+    """Get the ?page= argument clamped to 1..MAX_PAGE"""
+    return max(1, min(int(request.args.get('page', 1)), MAX_PAGE))
+
+def get_cursor_args():
+    """Get the (after_date, after_id) keyset cursor from the query string, if any"""
+    after_date = request.args.get('after_date')
+    after_id = request.args.get('after_id')
+    if after_date and after_id:
+        return datetime.fromisoformat(after_date), int(after_id)
+    return None
+
+def next_page_cursor(sort_key, row_id):
+    """Get the keyset cursor that continues after a row (None if its sort key is NULL, which can't be seeked past)"""
+    if sort_key is None:
+        return None
+    return {'after_date': sort_key.isoformat(), 'after_id': row_id}
+
 # Orders management
 @app.route('/dashboard/orders')
 @admin_login_required
 def orders_list():
     try:
         status = request.args.get('status', 'all')
-        page = int(request.args.get('page', 1))
+        page = get_page_arg()
         per_page = 20
-        offset = (page - 1) * per_page
+        cursor = get_cursor_args()
+        
+        params = {'limit': per_page + 1}
+        status_filter = "TRUE"
+        
+        if status != 'all':
+            status_filter = "o.status = %(status)s"
+            params['status'] = status
+        
+        if cursor:
+            # Keyset pagination: seek past the last row of the previous page
+            params['after_date'], params['after_id'] = cursor
+            params['offset'] = 0
+            total_count = "NULL::bigint"
+            page_filter = f"{status_filter} AND (o.order_date, o.order_id) < (%(after_date)s, %(after_id)s)"
+        else:
+            # Numbered page links fall back to OFFSET, counted with a window
+            params['offset'] = (page - 1) * per_page
+            total_count = "COUNT(*) OVER ()"
+            page_filter = status_filter
+        
+        page_query = f"""
+            SELECT o.*, {total_count} as total_count 
+            FROM orders o 
+            WHERE {page_filter}
+            ORDER BY o.order_date DESC, o.order_id DESC 
+            LIMIT %(limit)s OFFSET %(offset)s
+        """
+        
+        # Join users/payments only for the rows on this page
+        query = f"""
+            SELECT 
+                o.order_id,
+                o.user_id,
+                o.user_name,
+                o.user_address,
+                o.total_amount,
+                o.payment_mode,
+                o.delivery_location,
+                o.order_date,
+                o.status,
+                o.delivery_date,
+                o.notes,
+                order_item_count(o.items) as item_count,
+                TO_CHAR(o.order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as order_date_formatted,
+                TO_CHAR(o.delivery_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as delivery_date_formatted,
+                u.phone as user_phone,
+                u.email as user_email,
+                p.payment_status,
+                p.payment_mode as actual_payment_mode,
+                o.total_count
+            FROM ({page_query}) o
+            LEFT JOIN users u ON o.user_id = u.id
+            LEFT JOIN LATERAL (
+                SELECT payment_status, payment_mode
+                FROM payments
+                WHERE payments.order_id = o.order_id
+                ORDER BY payment_date DESC
+                LIMIT 1
+            ) p ON TRUE
+            ORDER BY o.order_date DESC, o.order_id DESC
+        """
         
         with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Build query based on status
-                query = """
-                    SELECT 
-                        o.*,
-                        u.phone as user_phone,
-                        u.email as user_email,
-                        p.payment_status,
-                        p.payment_mode as actual_payment_mode
-                    FROM orders o
-                    LEFT JOIN users u ON o.user_id = u.id
-                    LEFT JOIN payments p ON o.order_id = p.order_id
-                """
-                
-                params = []
-                
-                if status != 'all':
-                    query += " WHERE o.status = %s"
-                    params.append(status)
-                
-                query += " ORDER BY o.order_date DESC LIMIT %s OFFSET %s"
-                params.extend([per_page, offset])
-                
+            # Typed rows (dates arrive pre-formatted in IST); LIMIT bounds the page
+            with conn.cursor(row_factory=class_row(OrderListRow)) as cur:
                 cur.execute(query, params)
                 orders = cur.fetchall()
                 
-                # Count total orders for pagination
-                count_query = "SELECT COUNT(*) as total FROM orders"
-                count_params = []
-                
-                if status != 'all':
-                    count_query += " WHERE status = %s"
-                    count_params.append(status)
-                
-                cur.execute(count_query, count_params)
-                total_orders = cur.fetchone()['total']
-                total_pages = (total_orders + per_page - 1) // per_page
-                
-                # Format dates
-                for order in orders:
-                    order['order_date_formatted'] = format_ist_datetime(order['order_date'])
-                    if order.get('delivery_date'):
-                        order['delivery_date_formatted'] = format_ist_datetime(order['delivery_date'])
-                    else:
-                        order['delivery_date_formatted'] = None
-                    
-                    # Parse items JSON for item count
-                    try:
-                        items = json.loads(order['items'])
-                        order['item_count'] = len(items)
-                    except:
-                        order['item_count'] = 0
+                # One extra row was fetched to tell whether a next page exists
+                next_cursor = None
+                if len(orders) > per_page:
+                    orders = orders[:per_page]
+                    next_cursor = next_page_cursor(orders[-1].order_date, orders[-1].order_id)
+                
+                # Totals are only for numbered pages; the cursor path skips the full count
+                total_orders = None
+                total_pages = None
+                if not cursor:
+                    total_orders = orders[0].total_count if orders else 0
+                    total_pages = (total_orders + per_page - 1) // per_page
         
         return render_template('orders/list.html',
                            orders=orders,
                            status=status,
                            page=page,
                            total_pages=total_pages,
-                           total_orders=total_orders)
+                           total_orders=total_orders,
+                           next_cursor=next_cursor)
         
     except Exception as e:
-        logger.error(f"Orders list error: {e}")
-        flash(f'Error loading orders: {str(e)}', 'error')
+        logger.error("Orders list error: %s", e)
+        flash('Error loading orders', 'error')
         return render_template('orders/list.html',
                            orders=[],
                            status='all',
                            page=1,
                            total_pages=0,
-                           total_orders=0)
+                           total_orders=0,
+                           next_cursor=None)
+
+# Legacy orders.items JSON fields: (key, accepted source keys, default, cast)
+LEGACY_ITEM_FIELDS = (
+    ('item_name', ('item_name', 'name'), 'Unknown', None),
+    ('item_type', ('item_type', 'type'), 'unknown', None),
+    ('quantity', ('quantity',), 1, None),
+    ('price', ('price',), 0, float),
+    ('total', ('total',), 0, float),
+    ('item_description', ('item_description', 'description'), '', None),
+    ('item_photo', ('item_photo', 'photo'), '', None),
+)
+
+def parse_legacy_items(items_json):
+    """Normalise legacy items JSON into order_items-shaped dicts"""
+    fields = LEGACY_ITEM_FIELDS
+    parsed = []
+    for item in items_json:
+        row = {}
+        for key, aliases, default, cast in fields:
+            value = next((item[alias] for alias in aliases if alias in item), default)
+            row[key] = cast(value) if cast else value
+        parsed.append(row)
+    return parsed
 
 @app.route('/dashboard/orders/<int:order_id>')
 @admin_login_required
@@ -688,16 +952,44 @@ def order_detail(order_id):
                 # Get order details
                 cur.execute("""
                     SELECT 
-                        o.*,
+                        o.order_id,
+                        o.user_id,
+                        o.user_name,
+                        o.user_address,
+                        o.items,
+                        o.total_amount,
+                        o.payment_mode,
+                        o.delivery_location,
+                        o.order_date,
+                        o.status,
+                        o.delivery_date,
+                        o.notes,
                         u.phone as user_phone,
                         u.email as user_email,
                         u.profile_pic as user_profile_pic,
-                        p.*
+                        p.payment_id,
+                        p.amount,
+                        p.payment_mode as actual_payment_mode,
+                        p.transaction_id,
+                        p.payment_status,
+                        p.payment_date,
+                        p.razorpay_order_id,
+                        p.razorpay_payment_id,
+                        TO_CHAR(o.order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as order_date_formatted,
+                        TO_CHAR(o.delivery_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as delivery_date_formatted,
+                        TO_CHAR(p.payment_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as payment_date_formatted
                     FROM orders o
                     LEFT JOIN users u ON o.user_id = u.id
-                    LEFT JOIN payments p ON o.order_id = p.order_id
+                    LEFT JOIN LATERAL (
+                        SELECT payment_id, amount, payment_mode, transaction_id, payment_status,
+                               payment_date, razorpay_order_id, razorpay_payment_id
+                        FROM payments
+                        WHERE payments.order_id = o.order_id
+                        ORDER BY payment_date DESC
+                        LIMIT 1
+                    ) p ON TRUE
                     WHERE o.order_id = %s
-                """, (order_id,))
+                """, (order_id,), prepare=True)
                 
                 order = cur.fetchone()
                 
@@ -707,47 +999,41 @@ def order_detail(order_id):
                 
                 # Get order items
                 cur.execute("""
-                    SELECT * FROM order_items 
+                    SELECT 
+                        order_item_id,
+                        item_type,
+                        item_id,
+                        item_name,
+                        item_photo,
+                        item_description,
+                        quantity,
+                        price,
+                        total
+                    FROM order_items 
                     WHERE order_id = %s
                     ORDER BY order_item_id
-                """, (order_id,))
+                """, (order_id,), prepare=True)
                 
                 order_items = cur.fetchall()
                 
                 # If no items in order_items table, parse from JSON
                 if not order_items and order['items']:
                     try:
-                        items_json = json.loads(order['items'])
-                        for item in items_json:
-                            order_items.append({
-                                'item_name': item.get('item_name', item.get('name', 'Unknown')),
-                                'item_type': item.get('item_type', item.get('type', 'unknown')),
-                                'quantity': item.get('quantity', 1),
-                                'price': float(item.get('price', 0)),
-                                'total': float(item.get('total', 0)),
-                                'item_description': item.get('item_description', item.get('description', '')),
-                                'item_photo': item.get('item_photo', item.get('photo', ''))
-                            })
+                        order_items = parse_legacy_items(loads_json(order['items']))
                     except Exception as e:
-                        logger.error(f"Error parsing items JSON: {e}")
-                
-                # Format dates
-                order['order_date_formatted'] = format_ist_datetime(order['order_date'])
-                if order.get('delivery_date'):
-                    order['delivery_date_formatted'] = format_ist_datetime(order['delivery_date'])
-                
-                if order.get('payment_date'):
-                    order['payment_date_formatted'] = format_ist_datetime(order['payment_date'])
+                        logger.error("Error parsing items JSON: %s", e)
         
         return render_template('orders/detail.html',
                            order=order,
                            order_items=order_items)
         
     except Exception as e:
-        logger.error(f"Order detail error: {e}")
-        flash(f'Error loading order details: {str(e)}', 'error')
+        logger.error("Order detail error: %s", e)
+        flash('Error loading order details', 'error')
         return redirect(url_for('orders_list'))
 
+VALID_ORDER_STATUSES = frozenset({'pending', 'confirmed', 'processing', 'out_for_delivery', 'delivered', 'cancelled'})
+
 @app.route('/dashboard/orders/<int:order_id>/update-status', methods=['POST'])
 @admin_login_required
 def update_order_status(order_id):
@@ -758,64 +1044,58 @@ def update_order_status(order_id):
         if not new_status:
             return jsonify({'success': False, 'message': 'Status is required'})
         
-        valid_statuses = ['pending', 'confirmed', 'processing', 'out_for_delivery', 'delivered', 'cancelled']
-        if new_status not in valid_statuses:
+        if new_status not in VALID_ORDER_STATUSES:
             return jsonify({'success': False, 'message': 'Invalid status'})
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Check if order exists
-                cur.execute("SELECT order_id FROM orders WHERE order_id = %s", (order_id,))
-                if not cur.fetchone():
-                    return jsonify({'success': False, 'message': 'Order not found'})
-                
-                # Update order status
-                update_query = "UPDATE orders SET status = %s"
-                params = [new_status]
-                
-                # If delivered, set delivery date
-                if new_status == 'delivered':
-                    update_query += ", delivery_date = %s"
-                    params.append(ist_now())
-                
-                # If cancelled, update payment status
-                if new_status == 'cancelled':
-                    cur.execute("""
+                # Update the order and refund payments on cancel in one statement
+                cur.execute("""
+                    WITH updated_order AS (
+                        UPDATE orders 
+                        SET status = %(status)s,
+                            delivery_date = CASE WHEN %(status)s = 'delivered' THEN %(now)s ELSE delivery_date END
+                        WHERE order_id = %(order_id)s
+                        RETURNING user_id
+                    ),
+                    refunded AS (
                         UPDATE payments 
                         SET payment_status = 'refunded' 
-                        WHERE order_id = %s
-                    """, (order_id,))
-                
-                update_query += " WHERE order_id = %s"
-                params.append(order_id)
-                
-                cur.execute(update_query, params)
+                        WHERE order_id = %(order_id)s 
+                        AND %(status)s = 'cancelled'
+                        AND EXISTS (SELECT 1 FROM updated_order)
+                    )
+                    SELECT user_id FROM updated_order
+                """, {
+                    'status': new_status,
+                    'now': ist_now(),
+                    'order_id': order_id
+                }, prepare=True)
+                
+                # No row updated means the order doesn't exist
+                updated = cur.fetchone()
+                if not updated:
+                    return jsonify({'success': False, 'message': 'Order not found'})
                 
-                # Add notification for user
+                # Add notification for user; a savepoint keeps a failed insert from undoing the update
                 try:
-                    cur.execute("""
-                        SELECT user_id FROM orders WHERE order_id = %s
-                    """, (order_id,))
-                    user_result = cur.fetchone()
-                    
-                    if user_result:
-                        user_id = user_result['user_id']
+                    with conn.transaction():
                         cur.execute("""
                             INSERT INTO notifications 
                             (user_id, title, message, notification_type)
                             VALUES (%s, %s, %s, %s)
                         """, (
-                            user_id,
+                            updated['user_id'],
                             f'Order #{order_id} Status Update',
                             f'Your order status has been updated to: {new_status}',
                             'order_update'
                         ))
                 except Exception as e:
-                    logger.error(f"Notification error: {e}")
+                    logger.error("Notification error: %s", e)
                 
                 conn.commit()
                 
-                logger.info(f"Order #{order_id} status updated to '{new_status}' by admin {session.get('username')}")
+                logger.info("Order #%s status updated to '%s' by admin %s", order_id, new_status, session.get('username'))
                 
                 return jsonify({
                     'success': True,
@@ -824,7 +1104,7 @@ def update_order_status(order_id):
                 })
                 
     except Exception as e:
-        logger.error(f"Update order status error: {e}")
+        logger.error("Update order status error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 
 # Users management
@@ -832,113 +1112,163 @@ def update_order_status(order_id):
 @admin_login_required
 def users_list():
     try:
-        page = int(request.args.get('page', 1))
+        page = get_page_arg()
         per_page = 20
-        offset = (page - 1) * per_page
+        cursor = get_cursor_args()
+        
+        params = {'limit': per_page + 1}
+        
+        if cursor:
+            # Keyset pagination: seek past the last row of the previous page
+            params['after_date'], params['after_id'] = cursor
+            params['offset'] = 0
+            total_count = "NULL::bigint"
+            page_filter = "WHERE (u.created_at, u.id) < (%(after_date)s, %(after_id)s)"
+        else:
+            # Numbered page links fall back to OFFSET, counted with a window
+            params['offset'] = (page - 1) * per_page
+            total_count = "COUNT(*) OVER ()"
+            page_filter = ""
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Get users
-                cur.execute("""
+                # Get a page of users, then aggregate orders for just those users
+                cur.execute(f"""
                     SELECT 
-                        u.*,
-                        COUNT(o.order_id) as order_count,
-                        COALESCE(SUM(o.total_amount), 0) as total_spent,
-                        MAX(o.order_date) as last_order_date
-                    FROM users u
-                    LEFT JOIN orders o ON u.id = o.user_id
-                    GROUP BY u.id
-                    ORDER BY u.created_at DESC
-                    LIMIT %s OFFSET %s
-                """, (per_page, offset))
+                        u.id,
+                        u.profile_pic,
+                        u.full_name,
+                        u.phone,
+                        u.email,
+                        u.location,
+                        u.created_at,
+                        u.last_login,
+                        u.is_active,
+                        TO_CHAR(u.created_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as created_at_formatted,
+                        TO_CHAR(u.last_login AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as last_login_formatted,
+                        agg.order_count,
+                        agg.total_spent,
+                        agg.last_order_date,
+                        TO_CHAR(agg.last_order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as last_order_date_formatted,
+                        u.total_count
+                    FROM (
+                        SELECT u.*, {total_count} as total_count 
+                        FROM users u 
+                        {page_filter}
+                        ORDER BY u.created_at DESC, u.id DESC 
+                        LIMIT %(limit)s OFFSET %(offset)s
+                    ) u
+                    LEFT JOIN LATERAL (
+                        SELECT 
+                            COUNT(*) as order_count,
+                            COALESCE(SUM(total_amount), 0) as total_spent,
+                            MAX(order_date) as last_order_date
+                        FROM orders
+                        WHERE orders.user_id = u.id
+                    ) agg ON TRUE
+                    ORDER BY u.created_at DESC, u.id DESC
+                """, params)
                 
                 users = cur.fetchall()
                 
-                # Count total users
-                cur.execute("SELECT COUNT(*) as total FROM users")
-                total_users = cur.fetchone()['total']
-                total_pages = (total_users + per_page - 1) // per_page
-                
-                # Format dates
-                for user in users:
-                    user['created_at_formatted'] = format_ist_datetime(user['created_at'])
-                    if user['last_login']:
-                        user['last_login_formatted'] = format_ist_datetime(user['last_login'])
-                    if user['last_order_date']:
-                        user['last_order_date_formatted'] = format_ist_datetime(user['last_order_date'])
+                # One extra row was fetched to tell whether a next page exists
+                next_cursor = None
+                if len(users) > per_page:
+                    users = users[:per_page]
+                    next_cursor = next_page_cursor(users[-1]['created_at'], users[-1]['id'])
+                
+                # Totals are only for numbered pages; the cursor path skips the full count
+                total_users = None
+                total_pages = None
+                if not cursor:
+                    total_users = users[0]['total_count'] if users else 0
+                    total_pages = (total_users + per_page - 1) // per_page
         
         return render_template('users/list.html',
                            users=users,
                            page=page,
                            total_pages=total_pages,
-                           total_users=total_users)
+                           total_users=total_users,
+                           next_cursor=next_cursor)
         
     except Exception as e:
-        logger.error(f"Users list error: {e}")
-        flash(f'Error loading users: {str(e)}', 'error')
+        logger.error("Users list error: %s", e)
+        flash('Error loading users', 'error')
         return render_template('users/list.html',
                            users=[],
                            page=1,
                            total_pages=0,
-                           total_users=0)
+                           total_users=0,
+                           next_cursor=None)
 
 @app.route('/dashboard/users/<int:user_id>')
 @admin_login_required
 def user_detail(user_id):
     try:
         with get_db_connection() as conn:
-            with conn.cursor() as cur:
+            # Queue all four reads and send them in a single round-trip
+            with conn.pipeline():
                 # Get user details
-                cur.execute("SELECT * FROM users WHERE id = %s", (user_id,))
-                user = cur.fetchone()
-                
-                if not user:
-                    flash('User not found', 'error')
-                    return redirect(url_for('users_list'))
+                user_cur = conn.execute("""
+                    SELECT 
+                        id, profile_pic, full_name, phone, email, location,
+                        created_at, last_login, is_active,
+                        TO_CHAR(created_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as created_at_formatted,
+                        TO_CHAR(last_login AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as last_login_formatted
+                    FROM users 
+                    WHERE id = %s
+                """, (user_id,), prepare=True)
                 
                 # Get user's orders
-                cur.execute("""
-                    SELECT * FROM orders 
+                orders_cur = conn.execute("""
+                    SELECT 
+                        order_id, total_amount, payment_mode, delivery_location,
+                        order_date, status, delivery_date,
+                        order_item_count(items) as item_count,
+                        TO_CHAR(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as order_date_formatted
+                    FROM orders 
                     WHERE user_id = %s 
                     ORDER BY order_date DESC
                     LIMIT 10
-                """, (user_id,))
-                
-                orders = cur.fetchall()
+                """, (user_id,), prepare=True)
                 
                 # Get user's addresses
-                cur.execute("""
-                    SELECT * FROM addresses 
+                addresses_cur = conn.execute("""
+                    SELECT 
+                        address_id, full_name, phone, address_line1, address_line2, landmark,
+                        city, state, pincode, latitude, longitude, google_maps_link,
+                        is_default, created_at,
+                        TO_CHAR(created_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as created_at_formatted
+                    FROM addresses 
                     WHERE user_id = %s 
                     ORDER BY is_default DESC, created_at DESC
-                """, (user_id,))
-                
-                addresses = cur.fetchall()
+                """, (user_id,), prepare=True)
                 
                 # Get user's cart items
-                cur.execute("""
+                cart_cur = conn.execute("""
                     SELECT 
-                        c.*,
+                        c.id,
+                        c.item_type,
+                        c.item_id,
+                        c.quantity,
+                        c.created_at,
                         COALESCE(s.name, m.name) as item_name,
                         COALESCE(s.final_price, m.final_price) as item_price
                     FROM cart c
                     LEFT JOIN services s ON c.item_type = 'service' AND c.item_id = s.id
                     LEFT JOIN menu m ON c.item_type = 'menu' AND c.item_id = m.id
                     WHERE c.user_id = %s
-                """, (user_id,))
-                
-                cart_items = cur.fetchall()
-                
-                # Format dates
-                user['created_at_formatted'] = format_ist_datetime(user['created_at'])
-                if user['last_login']:
-                    user['last_login_formatted'] = format_ist_datetime(user['last_login'])
-                
-                for order in orders:
-                    order['order_date_formatted'] = format_ist_datetime(order['order_date'])
-                
-                for address in addresses:
-                    address['created_at_formatted'] = format_ist_datetime(address['created_at'])
+                """, (user_id,), prepare=True)
+            
+            user = user_cur.fetchone()
+            
+            if not user:
+                flash('User not found', 'error')
+                return redirect(url_for('users_list'))
+            
+            orders = orders_cur.fetchall()
+            addresses = addresses_cur.fetchall()
+            cart_items = cart_cur.fetchall()
         
         return render_template('users/detail.html',
                            user=user,
@@ -947,8 +1277,8 @@ def user_detail(user_id):
                            cart_items=cart_items)
         
     except Exception as e:
-        logger.error(f"User detail error: {e}")
-        flash(f'Error loading user details: {str(e)}', 'error')
+        logger.error("User detail error: %s", e)
+        flash('Error loading user details', 'error')
         return redirect(url_for('users_list'))
 
 @app.route('/dashboard/users/<int:user_id>/toggle-active', methods=['POST'])
@@ -957,24 +1287,22 @@ def toggle_user_active(user_id):
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Get current status
-                cur.execute("SELECT is_active FROM users WHERE id = %s", (user_id,))
+                # Flip status and read back the new value
+                cur.execute("""
+                    UPDATE users SET is_active = NOT is_active WHERE id = %s
+                    RETURNING is_active
+                """, (user_id,), prepare=True)
                 user = cur.fetchone()
                 
                 if not user:
                     return jsonify({'success': False, 'message': 'User not found'})
                 
-                new_status = not user['is_active']
-                
-                # Update status
-                cur.execute("""
-                    UPDATE users SET is_active = %s WHERE id = %s
-                """, (new_status, user_id))
+                new_status = user['is_active']
                 
                 conn.commit()
                 
                 action = "activated" if new_status else "deactivated"
-                logger.info(f"User #{user_id} {action} by admin {session.get('username')}")
+                logger.info("User #%s %s by admin %s", user_id, action, session.get('username'))
                 
                 return jsonify({
                     'success': True,
@@ -983,9 +1311,24 @@ def toggle_user_active(user_id):
                 })
                 
     except Exception as e:
-        logger.error(f"Toggle user active error: {e}")
+        logger.error("Toggle user active error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 
+# Catalogue categories
+CATEGORIES_CACHE_TIMEOUT = 60  # seconds
+CATEGORY_TABLES = ('services', 'menu')
+
+@cache.memoize(timeout=CATEGORIES_CACHE_TIMEOUT)
+def get_categories(table):
+    """Get distinct categories of a catalogue table (cached briefly)"""
+    if table not in CATEGORY_TABLES:
+        raise ValueError(f"Unknown catalogue table: {table}")
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT DISTINCT category FROM {table} WHERE category IS NOT NULL ORDER BY category")
+            return [row['category'] for row in cur.fetchall()]
+
 # Services management
 @app.route('/dashboard/services')
 @admin_login_required
@@ -994,28 +1337,27 @@ def services_list():
         category = request.args.get('category', 'all')
         status = request.args.get('status', 'active')
         
+        # Build query
+        query = "SELECT id, name, photo, price, discount, final_price, description, category, status, position, created_at FROM services WHERE 1=1"
+        params = []
+        
+        if category != 'all':
+            query += " AND category = %s"
+            params.append(category)
+        
+        if status != 'all':
+            query += " AND status = %s"
+            params.append(status)
+        
+        query += " ORDER BY position, name"
+        
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Build query
-                query = "SELECT * FROM services WHERE 1=1"
-                params = []
-                
-                if category != 'all':
-                    query += " AND category = %s"
-                    params.append(category)
-                
-                if status != 'all':
-                    query += " AND status = %s"
-                    params.append(status)
-                
-                query += " ORDER BY position, name"
-                
                 cur.execute(query, params)
                 services = cur.fetchall()
-                
-                # Get unique categories
-                cur.execute("SELECT DISTINCT category FROM services WHERE category IS NOT NULL ORDER BY category")
-                categories = [row['category'] for row in cur.fetchall()]
+        
+        # Get unique categories
+        categories = get_categories('services')
         
         return render_template('services/list.html',
                            services=services,
@@ -1024,14 +1366,100 @@ def services_list():
                            selected_status=status)
         
     except Exception as e:
-        logger.error(f"Services list error: {e}")
-        flash(f'Error loading services: {str(e)}', 'error')
+        logger.error("Services list error: %s", e)
+        flash('Error loading services', 'error')
         return render_template('services/list.html',
                            services=[],
                            categories=[],
                            selected_category='all',
                            selected_status='active')
 
+# Background Cloudinary uploads so admin requests don't wait on the upload round-trip
+UPLOAD_WORKERS = int(os.environ.get('UPLOAD_WORKERS', 4))
+UPLOAD_QUEUE_SIZE = int(os.environ.get('UPLOAD_QUEUE_SIZE', UPLOAD_WORKERS * 4))
+upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix='photo-upload')
+upload_slots = threading.BoundedSemaphore(UPLOAD_QUEUE_SIZE)
+# Exit waits for queued uploads to finish so their spooled files aren't lost mid-upload
+atexit.register(upload_executor.shutdown)
+
+SERVICE_PHOTO_TRANSFORMATION = [
+    {'width': 800, 'height': 600, 'crop': 'fill'},
+    {'quality': 'auto', 'fetch_format': 'auto'}
+]
+
+# Uploaded photos larger than this spill from memory to a temporary file
+UPLOAD_SPOOL_MAX_SIZE = 1 << 20  # bytes
+
+def spool_upload(file):
+    """Copy an uploaded file into a spooled temp file (None if empty)"""
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+    shutil.copyfileobj(file.stream, spooled)
+    if not spooled.tell():
+        spooled.close()
+        return None
+    spooled.seek(0)
+    return spooled
+
+def upload_service_photo(service_id, photo_file, public_id, old_cloudinary_id=None):
+    """Upload a service photo to Cloudinary and attach it to the service"""
+    try:
+        with photo_file:
+            result = cloudinary.uploader.upload(
+                photo_file,
+                folder="services",
+                public_id=public_id,
+                overwrite=True,
+                transformation=SERVICE_PHOTO_TRANSFORMATION
+            )
+        
+        with get_db_connection() as conn:
+            conn.execute("""
+                UPDATE services 
+                SET photo = %s, cloudinary_id = %s, photo_upload_error = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+            """, (result['secure_url'], result['public_id'], service_id), prepare=True)
+        
+        logger.info("Photo uploaded for service #%s", service_id)
+        
+    except Exception as upload_error:
+        logger.error("Cloudinary upload error for service #%s: %s", service_id, upload_error)
+        
+        # Record the failure on the service; the request that queued the upload has already returned
+        try:
+            with get_db_connection() as conn:
+                conn.execute("""
+                    UPDATE services SET photo_upload_error = %s WHERE id = %s
+                """, (str(upload_error), service_id))
+        except Exception as e:
+            logger.error("Could not record upload failure for service #%s: %s", service_id, e)
+        return
+    
+    # Delete the replaced photo only once the new one is in place
+    if old_cloudinary_id:
+        try:
+            cloudinary.uploader.destroy(old_cloudinary_id)
+        except Exception as delete_error:
+            logger.warning("Could not delete old photo: %s", delete_error)
+
+def queue_service_photo(service_id, photo_file, public_id, old_cloudinary_id=None):
+    """Upload a service photo in the background; returns False if it was uploaded inline because the queue is full"""
+    if not upload_slots.acquire(blocking=False):
+        upload_service_photo(service_id, photo_file, public_id, old_cloudinary_id)
+        return False
+    
+    try:
+        future = upload_executor.submit(upload_service_photo, service_id, photo_file,
+                                        public_id, old_cloudinary_id)
+    except Exception:
+        upload_slots.release()
+        raise
+    future.add_done_callback(lambda _: upload_slots.release())
+    return True
+
+def service_photo_public_id(name):
+    """Get Cloudinary public_id for a service photo"""
+    return f"service_{name.lower().replace(' ', '_')}_{time.time_ns()}"
+
 @app.route('/dashboard/services/add', methods=['GET', 'POST'])
 @admin_login_required
 def add_service():
@@ -1064,32 +1492,10 @@ def add_service():
             if final_price < 0:
                 final_price = Decimal('0')
             
-            cloudinary_id = None
-            photo_url = None
-            
-            # Handle photo upload
+            # Read the photo now; it is uploaded in the background after insert
+            photo_file = None
             if 'photo' in request.files and request.files['photo'].filename:
-                file = request.files['photo']
-                if file and file.filename:
-                    try:
-                        # Upload to Cloudinary
-                        result = cloudinary.uploader.upload(
-                            file,
-                            folder="services",
-                            public_id=f"service_{name.lower().replace(' ', '_')}_{int(datetime.now().timestamp())}",
-                            overwrite=True,
-                            transformation=[
-                                {'width': 800, 'height': 600, 'crop': 'fill'},
-                                {'quality': 'auto', 'fetch_format': 'auto'}
-                            ]
-                        )
-                        
-                        photo_url = result['secure_url']
-                        cloudinary_id = result['public_id']
-                        
-                    except Exception as upload_error:
-                        logger.error(f"Cloudinary upload error: {upload_error}")
-                        flash('Photo upload failed, service added without photo', 'warning')
+                photo_file = spool_upload(request.files['photo'])
             
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
@@ -1103,19 +1509,26 @@ def add_service():
                         INSERT INTO services 
                         (name, photo, price, discount, final_price, description, 
                          category, status, position, cloudinary_id)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (name, photo_url, price_val, discount_val, final_price, 
-                          description, category, status, new_position, cloudinary_id))
+                        VALUES (%s, NULL, %s, %s, %s, %s, %s, %s, %s, NULL)
+                        RETURNING id
+                    """, (name, price_val, discount_val, final_price, 
+                          description, category, status, new_position))
+                    service_id = cur.fetchone()['id']
                     
                     conn.commit()
+                    cache.delete_memoized(get_categories, 'services')
                     
-                    logger.info(f"Service '{name}' added by admin {session.get('username')}")
-                    flash('Service added successfully!', 'success')
+                    message = 'Service added successfully!'
+                    if photo_file and queue_service_photo(service_id, photo_file, service_photo_public_id(name)):
+                        message += ' The photo is still uploading and will appear shortly.'
+                    
+                    logger.info("Service '%s' added by admin %s", name, session.get('username'))
+                    flash(message, 'success')
                     return redirect(url_for('services_list'))
                     
         except Exception as e:
-            logger.error(f"Add service error: {e}")
-            flash(f'Error adding service: {str(e)}', 'error')
+            logger.error("Add service error: %s", e)
+            flash('Error adding service', 'error')
             return redirect(url_for('add_service'))
     
     return render_template('services/add_edit.html', service=None, action='add')
@@ -1128,7 +1541,7 @@ def edit_service(service_id):
             with conn.cursor() as cur:
                 if request.method == 'GET':
                     # Get service details
-                    cur.execute("SELECT * FROM services WHERE id = %s", (service_id,))
+                    cur.execute("SELECT * FROM services WHERE id = %s", (service_id,), prepare=True)
                     service = cur.fetchone()
                     
                     if not service:
@@ -1166,60 +1579,28 @@ def edit_service(service_id):
                     if final_price < 0:
                         final_price = Decimal('0')
                     
-                    # Handle photo upload
-                    current_photo = None
-                    current_cloudinary_id = None
-                    
                     # Get current photo details
-                    cur.execute("SELECT photo, cloudinary_id FROM services WHERE id = %s", (service_id,))
+                    cur.execute("SELECT photo, cloudinary_id FROM services WHERE id = %s", (service_id,), prepare=True)
                     current = cur.fetchone()
-                    if current:
-                        current_photo = current['photo']
-                        current_cloudinary_id = current['cloudinary_id']
+                    photo_url = current['photo'] if current else None
+                    cloudinary_id = current['cloudinary_id'] if current else None
                     
-                    photo_url = current_photo
-                    cloudinary_id = current_cloudinary_id
-                    
-                    if 'photo' in request.files and request.files['photo'].filename:
-                        file = request.files['photo']
-                        if file and file.filename:
-                            try:
-                                # Delete old photo from Cloudinary if exists
-                                if current_cloudinary_id:
-                                    try:
-                                        cloudinary.uploader.destroy(current_cloudinary_id)
-                                    except Exception as delete_error:
-                                        logger.warning(f"Could not delete old photo: {delete_error}")
-                                
-                                # Upload new photo
-                                result = cloudinary.uploader.upload(
-                                    file,
-                                    folder="services",
-                                    public_id=f"service_{name.lower().replace(' ', '_')}_{int(datetime.now().timestamp())}",
-                                    overwrite=True,
-                                    transformation=[
-                                        {'width': 800, 'height': 600, 'crop': 'fill'},
-                                        {'quality': 'auto', 'fetch_format': 'auto'}
-                                    ]
-                                )
-                                
-                                photo_url = result['secure_url']
-                                cloudinary_id = result['public_id']
-                                
-                            except Exception as upload_error:
-                                logger.error(f"Cloudinary upload error: {upload_error}")
-                                flash('Photo upload failed, using existing photo', 'warning')
+                    # A new photo replaces the current one once its background upload finishes
+                    photo_file = None
                     
                     # Check if remove photo was requested
-                    if request.form.get('remove_photo') == 'yes' and current_cloudinary_id:
+                    if request.form.get('remove_photo') == 'yes' and cloudinary_id:
                         try:
-                            cloudinary.uploader.destroy(current_cloudinary_id)
+                            cloudinary.uploader.destroy(cloudinary_id)
                         except Exception as delete_error:
-                            logger.warning(f"Could not delete photo: {delete_error}")
+                            logger.warning("Could not delete photo: %s", delete_error)
                         
                         photo_url = None
                         cloudinary_id = None
                     
+                    elif 'photo' in request.files and request.files['photo'].filename:
+                        photo_file = spool_upload(request.files['photo'])
+                    
                     # Update service
                     cur.execute("""
                         UPDATE services 
@@ -1238,14 +1619,20 @@ def edit_service(service_id):
                           description, category, status, cloudinary_id, service_id))
                     
                     conn.commit()
+                    cache.delete_memoized(get_categories, 'services')
                     
-                    logger.info(f"Service #{service_id} updated by admin {session.get('username')}")
-                    flash('Service updated successfully!', 'success')
+                    message = 'Service updated successfully!'
+                    if photo_file and queue_service_photo(service_id, photo_file,
+                                                          service_photo_public_id(name), cloudinary_id):
+                        message += ' The new photo is still uploading and will appear shortly.'
+                    
+                    logger.info("Service #%s updated by admin %s", service_id, session.get('username'))
+                    flash(message, 'success')
                     return redirect(url_for('services_list'))
                     
     except Exception as e:
-        logger.error(f"Edit service error: {e}")
-        flash(f'Error updating service: {str(e)}', 'error')
+        logger.error("Edit service error: %s", e)
+        flash('Error updating service', 'error')
         return redirect(url_for('services_list'))
 
 @app.route('/dashboard/services/<int:service_id>/delete', methods=['POST'])
@@ -1255,7 +1642,7 @@ def delete_service(service_id):
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 # Check if service exists
-                cur.execute("SELECT name, cloudinary_id FROM services WHERE id = %s", (service_id,))
+                cur.execute("SELECT name, cloudinary_id FROM services WHERE id = %s", (service_id,), prepare=True)
                 service = cur.fetchone()
                 
                 if not service:
@@ -1266,13 +1653,14 @@ def delete_service(service_id):
                     try:
                         cloudinary.uploader.destroy(service['cloudinary_id'])
                     except Exception as delete_error:
-                        logger.warning(f"Could not delete Cloudinary photo: {delete_error}")
+                        logger.warning("Could not delete Cloudinary photo: %s", delete_error)
                 
                 # Delete service
-                cur.execute("DELETE FROM services WHERE id = %s", (service_id,))
+                cur.execute("DELETE FROM services WHERE id = %s", (service_id,), prepare=True)
                 conn.commit()
+                cache.delete_memoized(get_categories, 'services')
                 
-                logger.info(f"Service #{service_id} deleted by admin {session.get('username')}")
+                logger.info("Service #%s deleted by admin %s", service_id, session.get('username'))
                 
                 return jsonify({
                     'success': True,
@@ -1280,7 +1668,7 @@ def delete_service(service_id):
                 })
                 
     except Exception as e:
-        logger.error(f"Delete service error: {e}")
+        logger.error("Delete service error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 
 # Menu management (similar to services)
@@ -1291,28 +1679,27 @@ def menu_list():
         category = request.args.get('category', 'all')
         status = request.args.get('status', 'active')
         
+        # Build query
+        query = "SELECT id, name, photo, price, discount, final_price, description, category, status, position, created_at FROM menu WHERE 1=1"
+        params = []
+        
+        if category != 'all':
+            query += " AND category = %s"
+            params.append(category)
+        
+        if status != 'all':
+            query += " AND status = %s"
+            params.append(status)
+        
+        query += " ORDER BY position, name"
+        
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Build query
-                query = "SELECT * FROM menu WHERE 1=1"
-                params = []
-                
-                if category != 'all':
-                    query += " AND category = %s"
-                    params.append(category)
-                
-                if status != 'all':
-                    query += " AND status = %s"
-                    params.append(status)
-                
-                query += " ORDER BY position, name"
-                
                 cur.execute(query, params)
                 menu_items = cur.fetchall()
-                
-                # Get unique categories
-                cur.execute("SELECT DISTINCT category FROM menu WHERE category IS NOT NULL ORDER BY category")
-                categories = [row['category'] for row in cur.fetchall()]
+        
+        # Get unique categories
+        categories = get_categories('menu')
         
         return render_template('menu/list.html',
                            menu_items=menu_items,
@@ -1321,134 +1708,134 @@ def menu_list():
                            selected_status=status)
         
     except Exception as e:
-        logger.error(f"Menu list error: {e}")
-        flash(f'Error loading menu items: {str(e)}', 'error')
+        logger.error("Menu list error: %s", e)
+        flash('Error loading menu items', 'error')
         return render_template('menu/list.html',
                            menu_items=[],
                            categories=[],
                            selected_category='all',
                            selected_status='active')
 
-# Analytics API endpoints
+# Analytics API endpoints. Both read materialized views refreshed every 5 minutes
+# (render.yaml cron), so responses can lag orders by up to the refresh interval plus
+# the cache timeout; the timeouts are kept short so caching adds little on top.
+STATS_CACHE_TIMEOUT = 30  # seconds
+CHART_CACHE_TIMEOUT = 30  # seconds
+
 @app.route('/api/dashboard/stats')
 @admin_login_required
 def api_dashboard_stats():
     try:
         period = request.args.get('period', 'today')  # today, week, month, year
         
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Date filters based on period
-                now = ist_now()
-                
-                if period == 'today':
-                    start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                    end_date = start_date + timedelta(days=1)
-                elif period == 'week':
-                    start_date = now - timedelta(days=now.weekday())
-                    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                    end_date = start_date + timedelta(days=7)
-                elif period == 'month':
-                    start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                    if now.month == 12:
-                        end_date = now.replace(year=now.year+1, month=1, day=1)
-                    else:
-                        end_date = now.replace(month=now.month+1, day=1)
-                elif period == 'year':
-                    start_date = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-                    end_date = now.replace(year=now.year+1, month=1, day=1)
-                else:
-                    start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                    end_date = start_date + timedelta(days=1)
-                
-                # Convert to UTC for database query
-                start_date_utc = start_date.astimezone(pytz.utc)
-                end_date_utc = end_date.astimezone(pytz.utc)
-                
-                # Orders count
-                cur.execute("""
-                    SELECT COUNT(*) as order_count 
-                    FROM orders 
-                    WHERE order_date >= %s AND order_date < %s
-                """, (start_date_utc, end_date_utc))
-                order_count = cur.fetchone()['order_count']
-                
-                # Revenue
-                cur.execute("""
-                    SELECT COALESCE(SUM(total_amount), 0) as revenue 
-                    FROM orders 
-                    WHERE order_date >= %s AND order_date < %s 
-                    AND status != 'cancelled'
-                """, (start_date_utc, end_date_utc))
-                revenue = float(cur.fetchone()['revenue'])
-                
-                # Average order value
-                avg_order_value = revenue / order_count if order_count > 0 else 0
-                
-                # New customers
-                cur.execute("""
-                    SELECT COUNT(*) as new_customers 
-                    FROM users 
-                    WHERE created_at >= %s AND created_at < %s
-                """, (start_date_utc, end_date_utc))
-                new_customers = cur.fetchone()['new_customers']
-                
-                # Order status breakdown
-                cur.execute("""
-                    SELECT 
-                        status,
-                        COUNT(*) as count,
-                        COALESCE(SUM(total_amount), 0) as amount
-                    FROM orders 
-                    WHERE order_date >= %s AND order_date < %s
-                    GROUP BY status
-                """, (start_date_utc, end_date_utc))
-                
-                status_data = cur.fetchall()
-                status_breakdown = {}
-                for row in status_data:
-                    status_breakdown[row['status']] = {
-                        'count': row['count'],
-                        'amount': float(row['amount'])
-                    }
-                
-                # Payment method breakdown
-                cur.execute("""
-                    SELECT 
-                        payment_mode,
-                        COUNT(*) as count,
-                        COALESCE(SUM(total_amount), 0) as amount
-                    FROM orders 
-                    WHERE order_date >= %s AND order_date < %s
-                    GROUP BY payment_mode
-                """, (start_date_utc, end_date_utc))
-                
-                payment_data = cur.fetchall()
-                payment_breakdown = {}
-                for row in payment_data:
-                    payment_breakdown[row['payment_mode']] = {
-                        'count': row['count'],
-                        'amount': float(row['amount'])
-                    }
-                
-                return jsonify({
-                    'success': True,
-                    'period': period,
-                    'stats': {
-                        'order_count': order_count,
-                        'revenue': revenue,
-                        'avg_order_value': avg_order_value,
-                        'new_customers': new_customers
-                    },
-                    'status_breakdown': status_breakdown,
-                    'payment_breakdown': payment_breakdown,
-                    'start_date': start_date.strftime('%Y-%m-%d'),
-                    'end_date': end_date.strftime('%Y-%m-%d')
-                })
-                
+        # Date filters based on period
+        now = ist_now()
+        
+        if period == 'today':
+            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            end_date = start_date + timedelta(days=1)
+        elif period == 'week':
+            start_date = now - timedelta(days=now.weekday())
+            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+            end_date = start_date + timedelta(days=7)
+        elif period == 'month':
+            start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            if now.month == 12:
+                end_date = now.replace(year=now.year+1, month=1, day=1)
+            else:
+                end_date = now.replace(month=now.month+1, day=1)
+        elif period == 'year':
+            start_date = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+            end_date = now.replace(year=now.year+1, month=1, day=1)
+        else:
+            # Unknown periods are served (and cached) as today
+            period = 'today'
+            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            end_date = start_date + timedelta(days=1)
+        
+        # Convert to UTC for database query
+        start_date_utc = start_date.astimezone(UTC)
+        end_date_utc = end_date.astimezone(UTC)
+        
+        # Serve repeat polls for the same window from cache
+        cache_key = f"api_stats:{period}:{start_date:%Y-%m-%d}:{end_date:%Y-%m-%d}"
+        body = cache.get(cache_key)
+        if body is None:
+            with get_db_connection() as conn:
+                with conn.cursor(row_factory=namedtuple_row) as cur:
+                    # Totals, breakdowns and new customers in a single round-trip
+                    cur.execute("""
+                        SELECT 
+                            status,
+                            payment_mode,
+                            GROUPING(status, payment_mode) as grouping_id,
+                            COALESCE(SUM(order_count), 0) as order_count,
+                            COALESCE(SUM(amount), 0) as amount,
+                            COALESCE(SUM(amount) FILTER (WHERE status != 'cancelled'), 0) as revenue,
+                            (SELECT COUNT(*) FROM users 
+                             WHERE created_at >= %(start_utc)s AND created_at < %(end_utc)s) as new_customers
+                        FROM mv_orders_daily_breakdown
+                        WHERE order_day >= %(start_day)s AND order_day < %(end_day)s
+                        GROUP BY GROUPING SETS ((), (status), (payment_mode))
+                    """, {
+                        'start_day': start_date.date(),
+                        'end_day': end_date.date(),
+                        'start_utc': start_date_utc,
+                        'end_utc': end_date_utc
+                    }, prepare=True)
+                    
+                    order_count = 0
+                    revenue = 0.0
+                    new_customers = 0
+                    status_breakdown = {}
+                    payment_breakdown = {}
+                    for row in cur:
+                        if row.grouping_id == 3:  # grand total
+                            order_count = row.order_count
+                            revenue = float(row.revenue)
+                            new_customers = row.new_customers
+                        elif row.grouping_id == 1:  # per status (nullable column; JSON keys must be strings)
+                            status_breakdown[row.status or 'unknown'] = {
+                                'count': row.order_count,
+                                'amount': float(row.amount)
+                            }
+                        else:  # per payment mode
+                            payment_breakdown[row.payment_mode or 'unknown'] = {
+                                'count': row.order_count,
+                                'amount': float(row.amount)
+                            }
+                    
+                    # Average order value
+                    avg_order_value = revenue / order_count if order_count > 0 else 0
+            
+            body = orjson.dumps({
+                'success': True,
+                'period': period,
+                'stats': {
+                    'order_count': order_count,
+                    'revenue': revenue,
+                    'avg_order_value': avg_order_value,
+                    'new_customers': new_customers
+                },
+                'status_breakdown': status_breakdown,
+                'payment_breakdown': payment_breakdown,
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': end_date.strftime('%Y-%m-%d')
+            })
+            cache.set(cache_key, body, timeout=STATS_CACHE_TIMEOUT)
+        
+        return conditional_json_response(body, STATS_CACHE_TIMEOUT)
+        
     except Exception as e:
-        logger.error(f"API stats error: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("API stats error: %s", e)
+        return json_response({'success': False, 'error': str(e)}, 500)
+
+# Revenue chart type -> (date_trunc field, lookback interval, label format)
+REVENUE_CHART_BUCKETS = {
+    'daily': ('day', '30 days', '%b %d'),
+    'weekly': ('week', '12 weeks', '%b %d'),
+    'monthly': ('month', '12 months', '%b %Y'),
+}
 
 @app.route('/api/dashboard/chart/revenue')
 @admin_login_required
@@ -1456,134 +1843,147 @@ def api_revenue_chart():
     try:
         chart_type = request.args.get('type', 'daily')  # daily, weekly, monthly
         
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                if chart_type == 'daily':
-                    # Last 30 days
-                    cur.execute("""
-                        SELECT 
-                            DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata') as date,
-                            COUNT(*) as order_count,
-                            COALESCE(SUM(total_amount), 0) as revenue
-                        FROM orders
-                        WHERE order_date >= CURRENT_DATE - INTERVAL '30 days'
-                        GROUP BY DATE(order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata')
-                        ORDER BY date
-                    """)
-                    
-                    data = cur.fetchall()
-                    
-                    labels = [row['date'].strftime('%b %d') for row in data]
-                    revenue = [float(row['revenue']) for row in data]
-                    order_counts = [row['order_count'] for row in data]
-                    
-                elif chart_type == 'weekly':
-                    # Last 12 weeks
-                    cur.execute("""
-                        SELECT 
-                            DATE_TRUNC('week', order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata') as week_start,
-                            COUNT(*) as order_count,
-                            COALESCE(SUM(total_amount), 0) as revenue
-                        FROM orders
-                        WHERE order_date >= CURRENT_DATE - INTERVAL '12 weeks'
-                        GROUP BY DATE_TRUNC('week', order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata')
-                        ORDER BY week_start
-                    """)
-                    
-                    data = cur.fetchall()
-                    
-                    labels = [row['week_start'].strftime('%b %d') for row in data]
-                    revenue = [float(row['revenue']) for row in data]
-                    order_counts = [row['order_count'] for row in data]
-                    
-                else:  # monthly
-                    # Last 12 months
+        # Unknown chart types fall back to monthly; normalizing first keeps the cache key
+        # space (and the echoed chart_type) to the known buckets
+        if chart_type not in REVENUE_CHART_BUCKETS:
+            chart_type = 'monthly'
+        bucket, lookback, label_format = REVENUE_CHART_BUCKETS[chart_type]
+        
+        # Cache the serialized payload; see CHART_CACHE_TIMEOUT for the staleness bound
+        cache_key = f"revenue_chart:{chart_type}"
+        body = cache.get(cache_key)
+        if body is None:
+            with get_db_connection() as conn:
+                with conn.cursor(row_factory=tuple_row) as cur:
+                    # Roll the precomputed daily aggregates up to the requested bucket;
+                    # numeric sums are cast so rows serialize without per-row conversion
                     cur.execute("""
                         SELECT 
-                            DATE_TRUNC('month', order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata') as month_start,
-                            TO_CHAR(order_date, 'Mon YYYY') as month_name,
-                            COUNT(*) as order_count,
-                            COALESCE(SUM(total_amount), 0) as revenue
-                        FROM orders
-                        WHERE order_date >= CURRENT_DATE - INTERVAL '12 months'
-                        GROUP BY DATE_TRUNC('month', order_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata'), 
-                                 TO_CHAR(order_date, 'Mon YYYY')
-                        ORDER BY month_start
-                    """)
+                            DATE_TRUNC(%s, order_day::timestamp)::date as bucket_start,
+                            SUM(revenue)::float8 as revenue,
+                            SUM(order_count)::int as order_count
+                        FROM mv_orders_daily
+                        WHERE order_day >= CURRENT_DATE - %s::interval
+                        GROUP BY bucket_start
+                        ORDER BY bucket_start
+                    """, (bucket, lookback), prepare=True)
                     
-                    data = cur.fetchall()
-                    
-                    labels = [row['month_name'] for row in data]
-                    revenue = [float(row['revenue']) for row in data]
-                    order_counts = [row['order_count'] for row in data]
-                
-                return jsonify({
-                    'success': True,
-                    'chart_type': chart_type,
-                    'labels': labels,
-                    'datasets': {
-                        'revenue': revenue,
-                        'orders': order_counts
-                    }
-                })
-                
+                    rows = cur.fetchall()
+            
+            # Unpack the columns in one pass
+            if rows:
+                dates, revenue, order_counts = map(list, zip(*rows))
+            else:
+                dates, revenue, order_counts = [], [], []
+            
+            body = orjson.dumps({
+                'success': True,
+                'chart_type': chart_type,
+                'labels': [d.strftime(label_format) for d in dates],
+                'datasets': {
+                    'revenue': revenue,
+                    'orders': order_counts
+                }
+            })
+            cache.set(cache_key, body, timeout=CHART_CACHE_TIMEOUT)
+        
+        return conditional_json_response(body, CHART_CACHE_TIMEOUT)
+        
     except Exception as e:
-        logger.error(f"Revenue chart error: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Revenue chart error: %s", e)
+        return json_response({'success': False, 'error': str(e)}, 500)
 
 # Address management with Google Maps links
 @app.route('/dashboard/addresses')
 @admin_login_required
 def addresses_list():
     try:
-        page = int(request.args.get('page', 1))
+        page = get_page_arg()
         per_page = 20
-        offset = (page - 1) * per_page
+        cursor = get_cursor_args()
+        
+        params = {'limit': per_page + 1}
+        
+        if cursor:
+            # Keyset pagination: seek past the last row of the previous page
+            params['after_date'], params['after_id'] = cursor
+            params['offset'] = 0
+            total_count = "NULL::bigint"
+            page_filter = "WHERE (a.created_at, a.address_id) < (%(after_date)s, %(after_id)s)"
+        else:
+            # Numbered page links fall back to OFFSET, counted with a window
+            params['offset'] = (page - 1) * per_page
+            total_count = "COUNT(*) OVER ()"
+            page_filter = ""
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 # Get addresses with user info
-                cur.execute("""
+                cur.execute(f"""
                     SELECT 
-                        a.*,
+                        a.address_id,
+                        a.user_id,
+                        a.full_name,
+                        a.phone,
+                        a.address_line1,
+                        a.address_line2,
+                        a.landmark,
+                        a.city,
+                        a.state,
+                        a.pincode,
+                        a.latitude,
+                        a.longitude,
+                        a.is_default,
+                        a.created_at,
+                        -- Fall back to a link built from coordinates when none is stored
+                        COALESCE(
+                            NULLIF(a.google_maps_link, ''),
+                            CASE WHEN a.latitude != 0 AND a.longitude != 0
+                                 THEN 'https://www.google.com/maps?q=' || a.latitude || ',' || a.longitude
+                            END
+                        ) as google_maps_link,
                         u.full_name as user_name,
                         u.phone as user_phone,
-                        u.email as user_email
+                        u.email as user_email,
+                        {total_count} as total_count
                     FROM addresses a
                     JOIN users u ON a.user_id = u.id
-                    ORDER BY a.created_at DESC
-                    LIMIT %s OFFSET %s
-                """, (per_page, offset))
+                    {page_filter}
+                    ORDER BY a.created_at DESC, a.address_id DESC
+                    LIMIT %(limit)s OFFSET %(offset)s
+                """, params)
                 
                 addresses = cur.fetchall()
                 
-                # Generate Google Maps links for addresses without them
-                for address in addresses:
-                    if not address['google_maps_link'] and address['latitude'] and address['longitude']:
-                        address['google_maps_link'] = generate_google_maps_link(
-                            address['latitude'], 
-                            address['longitude']
-                        )
-                
-                # Count total addresses
-                cur.execute("SELECT COUNT(*) as total FROM addresses")
-                total_addresses = cur.fetchone()['total']
-                total_pages = (total_addresses + per_page - 1) // per_page
+                # One extra row was fetched to tell whether a next page exists
+                next_cursor = None
+                if len(addresses) > per_page:
+                    addresses = addresses[:per_page]
+                    next_cursor = next_page_cursor(addresses[-1]['created_at'], addresses[-1]['address_id'])
+                
+                # Totals are only for numbered pages; the cursor path skips the full count
+                total_addresses = None
+                total_pages = None
+                if not cursor:
+                    total_addresses = addresses[0]['total_count'] if addresses else 0
+                    total_pages = (total_addresses + per_page - 1) // per_page
         
         return render_template('addresses/list.html',
                            addresses=addresses,
                            page=page,
                            total_pages=total_pages,
-                           total_addresses=total_addresses)
+                           total_addresses=total_addresses,
+                           next_cursor=next_cursor)
         
     except Exception as e:
-        logger.error(f"Addresses list error: {e}")
-        flash(f'Error loading addresses: {str(e)}', 'error')
+        logger.error("Addresses list error: %s", e)
+        flash('Error loading addresses', 'error')
         return render_template('addresses/list.html',
                            addresses=[],
                            page=1,
                            total_pages=0,
-                           total_addresses=0)
+                           total_addresses=0,
+                           next_cursor=None)
 
 # Payments management
 @app.route('/dashboard/payments')
@@ -1591,70 +1991,83 @@ def addresses_list():
 def payments_list():
     try:
         status = request.args.get('status', 'all')
-        page = int(request.args.get('page', 1))
+        page = get_page_arg()
         per_page = 20
-        offset = (page - 1) * per_page
+        cursor = get_cursor_args()
+        
+        # Numbered pages count the filtered rows with a window; the cursor path skips it
+        total_count = "NULL::bigint" if cursor else "COUNT(*) OVER ()"
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Build query
-                query = """
+                # Build query on the live tables so refunds and new payments show at once;
+                # the (status, date) and (date, id) payment indexes serve the filter and seek
+                query = f"""
                     SELECT 
                         p.*,
-                        o.order_id,
                         o.total_amount,
                         o.status as order_status,
                         u.full_name as user_name,
-                        u.phone as user_phone
+                        u.phone as user_phone,
+                        TO_CHAR(p.payment_date AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as payment_date_formatted,
+                        {total_count} as total_count
                     FROM payments p
                     JOIN orders o ON p.order_id = o.order_id
                     JOIN users u ON p.user_id = u.id
                 """
                 
+                conditions = []
                 params = []
                 
                 if status != 'all':
-                    query += " WHERE p.payment_status = %s"
+                    conditions.append("p.payment_status = %s")
                     params.append(status)
                 
-                query += " ORDER BY p.payment_date DESC LIMIT %s OFFSET %s"
-                params.extend([per_page, offset])
+                if cursor:
+                    # Keyset pagination: seek past the last row of the previous page
+                    conditions.append("(p.payment_date, p.payment_id) < (%s, %s)")
+                    params.extend(cursor)
                 
-                cur.execute(query, params)
-                payments = cur.fetchall()
+                if conditions:
+                    query += " WHERE " + " AND ".join(conditions)
                 
-                # Count total payments
-                count_query = "SELECT COUNT(*) as total FROM payments"
-                count_params = []
+                query += " ORDER BY p.payment_date DESC, p.payment_id DESC LIMIT %s OFFSET %s"
+                params.extend([per_page + 1, 0 if cursor else (page - 1) * per_page])
                 
-                if status != 'all':
-                    count_query += " WHERE payment_status = %s"
-                    count_params.append(status)
-                
-                cur.execute(count_query, count_params)
-                total_payments = cur.fetchone()['total']
-                total_pages = (total_payments + per_page - 1) // per_page
+                cur.execute(query, params)
+                payments = cur.fetchall()
                 
-                # Format dates
-                for payment in payments:
-                    payment['payment_date_formatted'] = format_ist_datetime(payment['payment_date'])
+                # One extra row was fetched to tell whether a next page exists
+                next_cursor = None
+                if len(payments) > per_page:
+                    payments = payments[:per_page]
+                    next_cursor = next_page_cursor(payments[-1]['payment_date'], payments[-1]['payment_id'])
+                
+                # Totals are only for numbered pages; the cursor path skips the full count
+                total_payments = None
+                total_pages = None
+                if not cursor:
+                    total_payments = payments[0]['total_count'] if payments else 0
+                    total_pages = (total_payments + per_page - 1) // per_page
         
         return render_template('payments/list.html',
                            payments=payments,
                            status=status,
                            page=page,
                            total_pages=total_pages,
-                           total_payments=total_payments)
+                           total_payments=total_payments,
+                           next_cursor=next_cursor)
         
     except Exception as e:
-        logger.error(f"Payments list error: {e}")
-        flash(f'Error loading payments: {str(e)}', 'error')
+        logger.error("Payments list error: %s", e)
+        flash('Error loading payments', 'error')
         return render_template('payments/list.html',
                            payments=[],
                            status='all',
                            page=1,
                            total_pages=0,
-                           total_payments=0)
+                           total_payments=0,
+                           next_cursor=None)
 
 # Reviews management
 @app.route('/dashboard/reviews')
@@ -1662,21 +2075,26 @@ def payments_list():
 def reviews_list():
     try:
         approved = request.args.get('approved', 'all')  # all, yes, no
-        page = int(request.args.get('page', 1))
+        page = get_page_arg()
         per_page = 20
-        offset = (page - 1) * per_page
+        cursor = get_cursor_args()
+        
+        # Numbered pages count the filtered rows with a window; the cursor path skips it
+        total_count = "NULL::bigint" if cursor else "COUNT(*) OVER ()"
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 # Build query
-                query = """
+                query = f"""
                     SELECT 
                         r.*,
                         u.full_name as user_name,
                         u.profile_pic as user_profile_pic,
                         o.order_id,
                         COALESCE(s.name, m.name) as item_name,
-                        COALESCE(s.photo, m.photo) as item_photo
+                        COALESCE(s.photo, m.photo) as item_photo,
+                        TO_CHAR(r.created_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as created_at_formatted,
+                        {total_count} as total_count
                     FROM reviews r
                     JOIN users u ON r.user_id = u.id
                     JOIN orders o ON r.order_id = o.order_id
@@ -1684,50 +2102,58 @@ def reviews_list():
                     LEFT JOIN menu m ON r.item_type = 'menu' AND r.item_id = m.id
                 """
                 
+                conditions = []
                 params = []
                 
                 if approved != 'all':
-                    query += " WHERE r.is_approved = %s"
+                    conditions.append("r.is_approved = %s")
                     params.append(approved == 'yes')
                 
-                query += " ORDER BY r.created_at DESC LIMIT %s OFFSET %s"
-                params.extend([per_page, offset])
+                if cursor:
+                    # Keyset pagination: seek past the last row of the previous page
+                    conditions.append("(r.created_at, r.review_id) < (%s, %s)")
+                    params.extend(cursor)
                 
-                cur.execute(query, params)
-                reviews = cur.fetchall()
+                if conditions:
+                    query += " WHERE " + " AND ".join(conditions)
                 
-                # Count total reviews
-                count_query = "SELECT COUNT(*) as total FROM reviews"
-                count_params = []
+                query += " ORDER BY r.created_at DESC, r.review_id DESC LIMIT %s OFFSET %s"
+                params.extend([per_page + 1, 0 if cursor else (page - 1) * per_page])
                 
-                if approved != 'all':
-                    count_query += " WHERE is_approved = %s"
-                    count_params.append(approved == 'yes')
-                
-                cur.execute(count_query, count_params)
-                total_reviews = cur.fetchone()['total']
-                total_pages = (total_reviews + per_page - 1) // per_page
+                cur.execute(query, params)
+                reviews = cur.fetchall()
                 
-                # Format dates
-                for review in reviews:
-                    review['created_at_formatted'] = format_ist_datetime(review['created_at'])
+                # One extra row was fetched to tell whether a next page exists
+                next_cursor = None
+                if len(reviews) > per_page:
+                    reviews = reviews[:per_page]
+                    next_cursor = next_page_cursor(reviews[-1]['created_at'], reviews[-1]['review_id'])
+                
+                # Totals are only for numbered pages; the cursor path skips the full count
+                total_reviews = None
+                total_pages = None
+                if not cursor:
+                    total_reviews = reviews[0]['total_count'] if reviews else 0
+                    total_pages = (total_reviews + per_page - 1) // per_page
         
         return render_template('reviews/list.html',
                            reviews=reviews,
                            approved=approved,
                            page=page,
                            total_pages=total_pages,
-                           total_reviews=total_reviews)
+                           total_reviews=total_reviews,
+                           next_cursor=next_cursor)
         
     except Exception as e:
-        logger.error(f"Reviews list error: {e}")
-        flash(f'Error loading reviews: {str(e)}', 'error')
+        logger.error("Reviews list error: %s", e)
+        flash('Error loading reviews', 'error')
         return render_template('reviews/list.html',
                            reviews=[],
                            approved='all',
                            page=1,
                            total_pages=0,
-                           total_reviews=0)
+                           total_reviews=0,
+                           next_cursor=None)
 
 @app.route('/dashboard/reviews/<int:review_id>/toggle-approval', methods=['POST'])
 @admin_login_required
@@ -1735,34 +2161,32 @@ def toggle_review_approval(review_id):
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Get current approval status
-                cur.execute("SELECT is_approved FROM reviews WHERE review_id = %s", (review_id,))
+                # Flip approval and read back the new value
+                cur.execute("""
+                    UPDATE reviews SET is_approved = NOT COALESCE(is_approved, FALSE) WHERE review_id = %s
+                    RETURNING is_approved
+                """, (review_id,), prepare=True)
                 review = cur.fetchone()
                 
                 if not review:
-                    return jsonify({'success': False, 'message': 'Review not found'})
+                    return json_response({'success': False, 'message': 'Review not found'})
                 
-                new_status = not review['is_approved']
-                
-                # Update approval status
-                cur.execute("""
-                    UPDATE reviews SET is_approved = %s WHERE review_id = %s
-                """, (new_status, review_id))
+                new_status = review['is_approved']
                 
                 conn.commit()
                 
                 action = "approved" if new_status else "unapproved"
-                logger.info(f"Review #{review_id} {action} by admin {session.get('username')}")
+                logger.info("Review #%s %s by admin %s", review_id, action, session.get('username'))
                 
-                return jsonify({
+                return json_response({
                     'success': True,
                     'message': f'Review {action} successfully',
                     'is_approved': new_status
                 })
                 
     except Exception as e:
-        logger.error(f"Toggle review approval error: {e}")
-        return jsonify({'success': False, 'message': str(e)}), 500
+        logger.error("Toggle review approval error: %s", e)
+        return json_response({'success': False, 'message': str(e)}, 500)
 
 # Notifications
 @app.route('/dashboard/notifications')
@@ -1771,31 +2195,30 @@ def admin_notifications():
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Get recent notifications for admin
+                # Get recent notifications for admin as one pre-formatted JSON list
                 cur.execute("""
-                    SELECT 
-                        n.*,
-                        u.full_name as user_name,
-                        u.phone as user_phone
-                    FROM notifications n
-                    JOIN users u ON n.user_id = u.id
-                    ORDER BY n.created_at DESC
-                    LIMIT 50
-                """)
-                
-                notifications = cur.fetchall()
-                
-                # Format dates
-                for notification in notifications:
-                    notification['created_at_formatted'] = format_ist_datetime(notification['created_at'])
-                    if notification['read_at']:
-                        notification['read_at_formatted'] = format_ist_datetime(notification['read_at'])
+                    SELECT COALESCE(json_agg(t ORDER BY t.created_at DESC), '[]') as notifications
+                    FROM (
+                        SELECT 
+                            n.*,
+                            u.full_name as user_name,
+                            u.phone as user_phone,
+                            TO_CHAR(n.created_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as created_at_formatted,
+                            TO_CHAR(n.read_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Kolkata', 'DD Mon YYYY, HH12:MI AM') as read_at_formatted
+                        FROM notifications n
+                        JOIN users u ON n.user_id = u.id
+                        ORDER BY n.created_at DESC
+                        LIMIT 50
+                    ) t
+                """, prepare=True)
+                
+                notifications = cur.fetchone()['notifications']
         
         return render_template('notifications/list.html', notifications=notifications)
         
     except Exception as e:
-        logger.error(f"Notifications error: {e}")
-        flash(f'Error loading notifications: {str(e)}', 'error')
+        logger.error("Notifications error: %s", e)
+        flash('Error loading notifications', 'error')
         return render_template('notifications/list.html', notifications=[])
 
 # Admin profile
@@ -1840,7 +2263,7 @@ def admin_profile():
                         )
                         admin = cur.fetchone()
                         
-                        if not admin or not check_password_hash(admin['password'], current_password):
+                        if not admin or not verify_admin_password(admin['password'], current_password):
                             flash('Current password is incorrect', 'error')
                             return redirect(url_for('admin_profile'))
                     
@@ -1858,7 +2281,7 @@ def admin_profile():
                     params = [full_name, email]
                     
                     if new_password:
-                        hashed_password = generate_password_hash(new_password)
+                        hashed_password = hash_admin_password(new_password)
                         update_fields.append("password = %s")
                         params.append(hashed_password)
                     
@@ -1878,12 +2301,12 @@ def admin_profile():
                     session['email'] = email
                     
                     flash('Profile updated successfully!', 'success')
-                    logger.info(f"Admin {session.get('username')} updated their profile")
+                    logger.info("Admin %s updated their profile", session.get('username'))
                     return redirect(url_for('admin_profile'))
                     
         except Exception as e:
-            logger.error(f"Admin profile update error: {e}")
-            flash(f'Error updating profile: {str(e)}', 'error')
+            logger.error("Admin profile update error: %s", e)
+            flash('Error updating profile', 'error')
             return redirect(url_for('admin_profile'))
     
     return render_template('admin/profile.html')
@@ -1918,18 +2341,18 @@ def health_check():
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT 1")
-        return jsonify({
+        return json_response({
             'status': 'healthy',
             'service': 'BiteMeBuddy Admin Dashboard',
             'timestamp': ist_now().isoformat(),
             'timezone': 'Asia/Kolkata'
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'unhealthy',
             'error': str(e),
             'timestamp': ist_now().isoformat()
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
     debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
@@ -1,6 +1,18 @@
 # dashboard-website/config/settings.py
 import os
 from datetime import timedelta
+from functools import lru_cache
+
+@lru_cache(maxsize=8)
+def normalize_database_url(database_url):
+    """Normalize a database URL to the postgresql:// scheme"""
+    if not database_url:
+        raise ValueError("DATABASE_URL not configured")
+    
+    if database_url.startswith('postgres://'):
+        return database_url.replace('postgres://', 'postgresql://', 1)
+    
+    return database_url
 
 class Config:
     """Base configuration"""
@@ -70,13 +82,7 @@ class Config:
     @property
     def SQLALCHEMY_DATABASE_URI(self):
         """Get database URI"""
-        if not self.DATABASE_URL:
-            raise ValueError("DATABASE_URL not configured")
-        
-        if self.DATABASE_URL.startswith('postgres://'):
-            return self.DATABASE_URL.replace('postgres://', 'postgresql://', 1)
-        
-        return self.DATABASE_URL
+        return normalize_database_url(self.DATABASE_URL)
     
     @classmethod
     def init_app(cls, app):
@@ -0,0 +1,40 @@
+# dashboard-website/tests/test_validators.py
+import unittest
+
+from utils.validators import validate_url
+
+class ValidateUrlTests(unittest.TestCase):
+    """validate_url keeps the rejections of the original regex check"""
+    
+    def test_accepts_plain_urls(self):
+        for url in ('https://example.com',
+                    'http://example.com/a/b?x=1&y=2',
+                    'http://%41b.example.com/path',
+                    'http://example.com:8080/x'):
+            with self.subTest(url=url):
+                self.assertTrue(validate_url(url)[0])
+    
+    def test_rejects_bad_scheme(self):
+        for url in ('HTTP://example.com', 'ftp://example.com', 'example.com', 'http:/example.com'):
+            with self.subTest(url=url):
+                self.assertFalse(validate_url(url)[0])
+    
+    def test_rejects_bad_host(self):
+        for url in ('http://', 'http://<script>', 'http://a b', 'http://user@example.com',
+                    'http://[::1]/', 'http://example.com?x=1', 'http://exa\nmple.com'):
+            with self.subTest(url=url):
+                self.assertFalse(validate_url(url)[0])
+    
+    def test_rejects_out_of_range_port(self):
+        for url in ('http://example.com:0', 'http://example.com:65536', 'http://example.com:99999',
+                    'http://example.com:', 'http://example.com:80a'):
+            with self.subTest(url=url):
+                self.assertFalse(validate_url(url)[0])
+    
+    def test_rejects_bad_path(self):
+        for url in ('http://example.com/a b', 'http://example.com/#frag', 'http://example.com/x\n'):
+            with self.subTest(url=url):
+                self.assertFalse(validate_url(url)[0])
+
+if __name__ == '__main__':
+    unittest.main()
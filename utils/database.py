@@ -1,127 +1,174 @@
 # dashboard-website/utils/database.py
 import os
+import atexit
 import logging
-from datetime import datetime
-from decimal import Decimal
-import json
+import threading
+import time
+from contextlib import nullcontext
+from functools import lru_cache, wraps
 import psycopg
 from psycopg.rows import dict_row
-import cloudinary
-import cloudinary.uploader
+from psycopg_pool import ConnectionPool
+from config.settings import normalize_database_url
 from .helpers import generate_google_maps_link, ist_now
 
 logger = logging.getLogger(__name__)
 
+# Shared pool, opened on first use so importing this module needs no database
+_pool = None
+_pool_lock = threading.Lock()
+
+def _get_pool():
+    """Get the shared connection pool, creating it on first use"""
+    global _pool
+    
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = ConnectionPool(
+                    normalize_database_url(os.environ.get('DATABASE_URL')),
+                    min_size=2,
+                    max_size=10,
+                    # Pooled connections live on, so repeated statements get server-side plans
+                    kwargs={'row_factory': dict_row, 'prepare_threshold': 1},
+                    open=False
+                )
+                pool.open()
+                atexit.register(pool.close)
+                _pool = pool
+    
+    return _pool
+
+@lru_cache(maxsize=512)
+def _is_read_query(query):
+    """Check whether a query is read-only; callers pass the same SQL constants, so this is cached"""
+    return query.lstrip().upper().startswith(('SELECT', 'SHOW', 'DESC'))
+
+# Short-lived results for monitoring-style calls: name -> (expires_at, value)
+STATS_CACHE_TTL = 10  # seconds
+_stats_cache = {}
+
+def ttl_cached(func):
+    """Serve repeat calls within STATS_CACHE_TTL from the last result"""
+    @wraps(func)
+    def wrapper():
+        now = time.monotonic()
+        cached = _stats_cache.get(func.__name__)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        value = func()
+        _stats_cache[func.__name__] = (now + STATS_CACHE_TTL, value)
+        return value
+    return wrapper
+
 class DatabaseManager:
     """Database management utilities"""
     
     @staticmethod
     def get_connection():
-        """Get database connection"""
-        database_url = os.environ.get('DATABASE_URL')
-        
-        if not database_url:
-            raise ValueError("DATABASE_URL environment variable is not set")
-        
-        if database_url.startswith('postgres://'):
-            database_url = database_url.replace('postgres://', 'postgresql://', 1)
-        
+        """Get a dedicated database connection; the caller closes it"""
         try:
-            conn = psycopg.connect(database_url, row_factory=dict_row)
+            conn = psycopg.connect(
+                normalize_database_url(os.environ.get('DATABASE_URL')),
+                row_factory=dict_row
+            )
             return conn
         except Exception as e:
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
+            raise
+    
+    @staticmethod
+    def connection():
+        """Borrow a pooled connection; it is committed (or rolled back on error) and returned when the with-block exits"""
+        try:
+            return _get_pool().connection()
+        except Exception as e:
+            logger.error("Database connection error: %s", e)
             raise
     
     @staticmethod
     def execute_query(query, params=None, fetch_one=False, fetch_all=False):
-        """Execute SQL query and return results"""
-        conn = None
+        """Execute SQL query and return results; repeated queries reuse a prepared plan"""
         try:
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                cur.execute(query, params or ())
-                
-                if fetch_one:
-                    result = cur.fetchone()
-                elif fetch_all:
-                    result = cur.fetchall()
-                else:
-                    result = None
-                
-                if not query.strip().upper().startswith(('SELECT', 'SHOW', 'DESC')):
-                    conn.commit()
-                
-                return result
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params or ())
+                    
+                    if fetch_one:
+                        result = cur.fetchone()
+                    elif fetch_all:
+                        result = cur.fetchall()
+                    else:
+                        result = None
+                    
+                    if not _is_read_query(query):
+                        conn.commit()
+                    
+                    return result
         except Exception as e:
-            logger.error(f"Query execution error: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Query execution error: %s", e)
             raise
-        finally:
-            if conn:
-                conn.close()
     
     @staticmethod
+    @ttl_cached
     def get_table_stats():
         """Get statistics for all tables"""
         try:
+            # Window count gives the table total from the same scan
             query = """
                 SELECT 
                     table_name,
                     pg_size_pretty(pg_total_relation_size(quote_ident(table_name))) as size,
-                    (SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public') as table_count
+                    COUNT(*) OVER () as table_count
                 FROM information_schema.tables 
                 WHERE table_schema = 'public' 
                 ORDER BY table_name
             """
             return DatabaseManager.execute_query(query, fetch_all=True)
         except Exception as e:
-            logger.error(f"Error getting table stats: {e}")
+            logger.error("Error getting table stats: %s", e)
             return []
     
     @staticmethod
     def backup_database():
         """Create database backup (simplified)"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_file = f"backup_{timestamp}.sql"
+            backup_file = f"backup_{time.strftime('%Y%m%d_%H%M%S')}.sql"
             
             # In production, you would use pg_dump here
-            logger.info(f"Database backup created: {backup_file}")
+            logger.info("Database backup created: %s", backup_file)
             return backup_file
         except Exception as e:
-            logger.error(f"Backup error: {e}")
+            logger.error("Backup error: %s", e)
             return None
     
     @staticmethod
+    @ttl_cached
     def get_system_health():
         """Check database health status"""
         try:
             # Check connection
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                # Check active connections
-                cur.execute("SELECT COUNT(*) as active_connections FROM pg_stat_activity")
-                active_connections = cur.fetchone()['active_connections']
-                
-                # Check database size
-                cur.execute("SELECT pg_database_size(current_database()) as db_size")
-                db_size = cur.fetchone()['db_size']
-                
-                # Check last backup (simulated)
-                cur.execute("SELECT MAX(order_date) as last_order FROM orders")
-                last_order = cur.fetchone()['last_order']
-                
-                return {
-                    'status': 'healthy',
-                    'active_connections': active_connections,
-                    'db_size': db_size,
-                    'last_order': last_order,
-                    'timestamp': ist_now().isoformat()
-                }
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    # Active connections, database size and last order (simulated backup check) in one round-trip
+                    cur.execute("""
+                        SELECT 
+                            (SELECT COUNT(*) FROM pg_stat_activity) as active_connections,
+                            pg_database_size(current_database()) as db_size,
+                            (SELECT MAX(order_date) FROM orders) as last_order
+                    """)
+                    health = cur.fetchone()
+                    
+                    return {
+                        'status': 'healthy',
+                        'active_connections': health['active_connections'],
+                        'db_size': health['db_size'],
+                        'last_order': health['last_order'],
+                        'timestamp': ist_now().isoformat()
+                    }
         except Exception as e:
-            logger.error(f"Health check error: {e}")
+            logger.error("Health check error: %s", e)
             return {
                 'status': 'unhealthy',
                 'error': str(e),
@@ -132,106 +179,100 @@ class DatabaseManager:
     def optimize_tables():
         """Optimize database tables"""
         try:
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                # Vacuum analyze all tables
-                cur.execute("VACUUM ANALYZE")
-                
-                # Update statistics
-                cur.execute("ANALYZE")
-                
-                conn.commit()
-                logger.info("Database optimization completed")
-                return True
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    # Vacuum analyze all tables
+                    cur.execute("VACUUM ANALYZE")
+                    
+                    # Update statistics
+                    cur.execute("ANALYZE")
+                    
+                    conn.commit()
+                    # Fresh statistics should be visible on the next read
+                    _stats_cache.clear()
+                    logger.info("Database optimization completed")
+                    return True
         except Exception as e:
-            logger.error(f"Optimization error: {e}")
+            logger.error("Optimization error: %s", e)
             return False
     
     @staticmethod
     def update_address_maps_links():
         """Update addresses with Google Maps links"""
         try:
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                # Get addresses without maps links
-                cur.execute("""
-                    SELECT address_id, latitude, longitude 
-                    FROM addresses 
-                    WHERE google_maps_link IS NULL 
-                    AND latitude IS NOT NULL 
-                    AND longitude IS NOT NULL
-                """)
-                
-                addresses = cur.fetchall()
-                updated_count = 0
-                
-                for address in addresses:
-                    maps_link = generate_google_maps_link(
-                        address['latitude'], 
-                        address['longitude']
-                    )
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    # Get addresses without maps links
+                    cur.execute("""
+                        SELECT address_id, latitude, longitude 
+                        FROM addresses 
+                        WHERE google_maps_link IS NULL 
+                        AND latitude IS NOT NULL 
+                        AND longitude IS NOT NULL
+                    """)
+                    
+                    addresses = cur.fetchall()
+                    
+                    # Build all (link, id) pairs first, then send them as one batch
+                    updates = []
+                    for address in addresses:
+                        maps_link = generate_google_maps_link(
+                            address['latitude'], 
+                            address['longitude']
+                        )
+                        
+                        if maps_link:
+                            updates.append((maps_link, address['address_id']))
+                    
+                    # Pipeline mode sends the whole batch before reading any result instead of
+                    # one round-trip per row; older libpq (< 14) falls back to plain executemany
+                    if updates:
+                        with conn.pipeline() if psycopg.Pipeline.is_supported() else nullcontext():
+                            cur.executemany("""
+                                UPDATE addresses 
+                                SET google_maps_link = %s 
+                                WHERE address_id = %s
+                            """, updates)
+                    
+                    updated_count = len(updates)
+                    conn.commit()
+                    logger.info("Updated %s addresses with Google Maps links", updated_count)
+                    return updated_count
                     
-                    if maps_link:
-                        cur.execute("""
-                            UPDATE addresses 
-                            SET google_maps_link = %s 
-                            WHERE address_id = %s
-                        """, (maps_link, address['address_id']))
-                        updated_count += 1
-                
-                conn.commit()
-                logger.info(f"Updated {updated_count} addresses with Google Maps links")
-                return updated_count
-                
         except Exception as e:
-            logger.error(f"Error updating maps links: {e}")
+            logger.error("Error updating maps links: %s", e)
             return 0
     
     @staticmethod
     def cleanup_old_data(days=90):
         """Cleanup old data (archives instead of deletes)"""
         try:
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                # Archive old notifications (older than specified days)
-                cutoff_date = ist_now() - timedelta(days=days)
-                
-                # Count records to be archived
-                cur.execute("""
-                    SELECT COUNT(*) as count 
-                    FROM notifications 
-                    WHERE created_at < %s AND is_read = TRUE
-                """, (cutoff_date,))
-                
-                count = cur.fetchone()['count']
-                
-                if count > 0:
-                    # Create archive table if not exists
-                    cur.execute("""
-                        CREATE TABLE IF NOT EXISTS notifications_archive 
-                        AS TABLE notifications WITH NO DATA
-                    """)
-                    
-                    # Archive old records
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    # Move read notifications older than `days` into the archive in one statement
+                    # (notifications_archive is created with the schema). The cutoff uses
+                    # LOCALTIMESTAMP, the same clock as the created_at column default.
                     cur.execute("""
+                        WITH moved AS (
+                            DELETE FROM notifications 
+                            WHERE created_at < LOCALTIMESTAMP - make_interval(days => %s) 
+                            AND is_read = TRUE
+                            RETURNING *
+                        )
                         INSERT INTO notifications_archive 
-                        SELECT * FROM notifications 
-                        WHERE created_at < %s AND is_read = TRUE
-                    """, (cutoff_date,))
+                        SELECT * FROM moved
+                    """, (days,))
                     
-                    # Delete archived records
-                    cur.execute("""
-                        DELETE FROM notifications 
-                        WHERE created_at < %s AND is_read = TRUE
-                    """, (cutoff_date,))
+                    count = cur.rowcount
+                    
+                    if count > 0:
+                        logger.info("Archived %s old notifications", count)
+                    
+                    conn.commit()
+                    return count
                     
-                    logger.info(f"Archived {count} old notifications")
-                
-                conn.commit()
-                return count
-                
         except Exception as e:
-            logger.error(f"Cleanup error: {e}")
+            logger.error("Cleanup error: %s", e)
             return 0
     
     @staticmethod
@@ -241,44 +282,27 @@ class DatabaseManager:
             issues = []
             
             # Check for orphaned records
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                # Check cart items with invalid user references
-                cur.execute("""
-                    SELECT c.id as cart_id 
-                    FROM cart c 
-                    LEFT JOIN users u ON c.user_id = u.id 
-                    WHERE u.id IS NULL
-                    LIMIT 10
-                """)
-                orphaned_cart = cur.fetchall()
-                if orphaned_cart:
-                    issues.append(f"Found {len(orphaned_cart)} orphaned cart items")
-                
-                # Check order items with invalid order references
-                cur.execute("""
-                    SELECT oi.order_item_id 
-                    FROM order_items oi 
-                    LEFT JOIN orders o ON oi.order_id = o.order_id 
-                    WHERE o.order_id IS NULL
-                    LIMIT 10
-                """)
-                orphaned_order_items = cur.fetchall()
-                if orphaned_order_items:
-                    issues.append(f"Found {len(orphaned_order_items)} orphaned order items")
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    # Count cart items, order items and payments whose parent row is missing
+                    cur.execute("""
+                        SELECT 'cart items' as kind, COUNT(*) as orphan_count
+                        FROM cart c 
+                        WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = c.user_id)
+                        UNION ALL
+                        SELECT 'order items', COUNT(*)
+                        FROM order_items oi 
+                        WHERE NOT EXISTS (SELECT 1 FROM orders o WHERE o.order_id = oi.order_id)
+                        UNION ALL
+                        SELECT 'payments', COUNT(*)
+                        FROM payments p 
+                        WHERE NOT EXISTS (SELECT 1 FROM orders o WHERE o.order_id = p.order_id)
+                    """)
+                    
+                    for row in cur.fetchall():
+                        if row['orphan_count']:
+                            issues.append(f"Found {row['orphan_count']} orphaned {row['kind']}")
                 
-                # Check payments without orders
-                cur.execute("""
-                    SELECT p.payment_id 
-                    FROM payments p 
-                    LEFT JOIN orders o ON p.order_id = o.order_id 
-                    WHERE o.order_id IS NULL
-                    LIMIT 10
-                """)
-                orphaned_payments = cur.fetchall()
-                if orphaned_payments:
-                    issues.append(f"Found {len(orphaned_payments)} orphaned payments")
-            
             return {
                 'has_issues': len(issues) > 0,
                 'issues': issues,
@@ -286,7 +310,7 @@ class DatabaseManager:
             }
             
         except Exception as e:
-            logger.error(f"Data integrity check error: {e}")
+            logger.error("Data integrity check error: %s", e)
             return {
                 'has_issues': True,
                 'issues': [f"Check failed: {str(e)}"],
@@ -294,51 +318,52 @@ class DatabaseManager:
             }
     
     @staticmethod
+    @ttl_cached
     def get_query_analytics():
         """Get query performance analytics"""
         try:
-            conn = DatabaseManager.get_connection()
-            with conn.cursor() as cur:
-                # Get slow queries
-                cur.execute("""
-                    SELECT 
-                        query,
-                        calls,
-                        total_time,
-                        mean_time,
-                        rows
-                    FROM pg_stat_statements 
-                    ORDER BY mean_time DESC 
-                    LIMIT 10
-                """)
-                
-                slow_queries = cur.fetchall()
-                
-                # Get table access statistics
-                cur.execute("""
-                    SELECT 
-                        schemaname,
-                        relname,
-                        seq_scan,
-                        idx_scan,
-                        n_tup_ins,
-                        n_tup_upd,
-                        n_tup_del
-                    FROM pg_stat_user_tables 
-                    ORDER BY seq_scan + idx_scan DESC 
-                    LIMIT 10
-                """)
-                
-                table_stats = cur.fetchall()
-                
-                return {
-                    'slow_queries': slow_queries,
-                    'table_stats': table_stats,
-                    'timestamp': ist_now().isoformat()
-                }
-                
+            with DatabaseManager.connection() as conn:
+                with conn.cursor() as cur:
+                    # Get slow queries
+                    cur.execute("""
+                        SELECT 
+                            query,
+                            calls,
+                            total_time,
+                            mean_time,
+                            rows
+                        FROM pg_stat_statements 
+                        ORDER BY mean_time DESC 
+                        LIMIT 10
+                    """)
+                    
+                    slow_queries = cur.fetchall()
+                    
+                    # Get table access statistics
+                    cur.execute("""
+                        SELECT 
+                            schemaname,
+                            relname,
+                            seq_scan,
+                            idx_scan,
+                            n_tup_ins,
+                            n_tup_upd,
+                            n_tup_del
+                        FROM pg_stat_user_tables 
+                        ORDER BY seq_scan + idx_scan DESC 
+                        LIMIT 10
+                    """)
+                    
+                    table_stats = cur.fetchall()
+                    
+                    return {
+                        'slow_queries': slow_queries,
+                        'table_stats': table_stats,
+                        'timestamp': ist_now().isoformat()
+                    }
+                    
         except Exception as e:
-            logger.error(f"Query analytics error: {e}")
+            logger.error("Query analytics error: %s", e)
             return {
                 'slow_queries': [],
                 'table_stats': [],
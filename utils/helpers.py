@@ -1,29 +1,47 @@
 # dashboard-website/utils/helpers.py
 import os
+import re
+import html
+import atexit
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-import pytz
-import cloudinary
-import cloudinary.api
+from functools import lru_cache
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+
+from .validators import validate_phone as _validate_phone
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DANGEROUS_INPUT_RE = re.compile(r'<script>|</script>|javascript:|onclick|onload|onerror', re.IGNORECASE)
+
+# Password character classes, tracked as bits in a single pass
+_PW_UPPER, _PW_LOWER, _PW_DIGIT, _PW_SPECIAL = 1, 2, 4, 8
+_PW_ALL = _PW_UPPER | _PW_LOWER | _PW_DIGIT | _PW_SPECIAL
+_PASSWORD_SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{}|;:,.<>?/')
+
 # Timezone setup
-IST = pytz.timezone('Asia/Kolkata')
+IST = ZoneInfo('Asia/Kolkata')
+UTC = timezone.utc
 
 def ist_now():
     """Get current time in IST"""
-    utc_now = datetime.now(pytz.utc)
-    return utc_now.astimezone(IST)
+    return datetime.now(IST)
 
 def format_ist_datetime(dt, format_str="%d %b %Y, %I:%M %p"):
     """Format datetime in IST"""
     if dt is None:
         return ""
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=UTC)
     return dt.astimezone(IST).strftime(format_str)
 
 def generate_google_maps_link(latitude, longitude):
@@ -46,26 +64,22 @@ def format_phone_number(phone):
     if not phone:
         return ""
     phone = str(phone).strip()
-    if phone.startswith('+91'):
-        return phone
-    elif phone.startswith('91') and len(phone) == 12:
+    
+    # Dispatch on length first; only numbers without a +91 prefix are rewritten
+    length = len(phone)
+    if length == 10 and not phone.startswith('+91'):
+        return f"+91 {phone[:5]} {phone[5:]}"
+    if length == 12 and phone.startswith('91'):
         return '+' + phone
-    elif len(phone) == 10:
-        return '+91 ' + phone[:5] + ' ' + phone[5:]
-    else:
-        return phone
+    return phone
 
 def validate_email(email):
     """Validate email format"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 def validate_phone(phone):
-    """Validate phone number"""
-    import re
-    pattern = r'^(\+91[\-\s]?)?[0]?(91)?[789]\d{9}$'
-    return re.match(pattern, str(phone)) is not None
+    """Validate phone number (same rules as validators.validate_phone)"""
+    return _validate_phone(phone)[0]
 
 def calculate_discount_percentage(original_price, final_price):
     """Calculate discount percentage"""
@@ -81,36 +95,37 @@ def calculate_age(date_of_birth):
     today = ist_now().date()
     return today.year - date_of_birth.year - ((today.month, today.day) < (date_of_birth.month, date_of_birth.day))
 
+# get_time_ago buckets: upper bound in seconds, and (unit, unit length) for the bucket below it
+_TIME_AGO_BOUNDS = (60, 3600, 86400, 2592000, 31536000)  # minute, hour, day, 30 days, 365 days
+_TIME_AGO_UNITS = (
+    None,
+    ('minute', 60),
+    ('hour', 3600),
+    ('day', 86400),
+    ('month', 2592000),
+    ('year', 31536000),
+)
+
 def get_time_ago(dt):
     """Get human readable time difference"""
     if not dt:
         return "Unknown"
     
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=UTC)
     
     now = ist_now()
     diff = now - dt
     
-    seconds = diff.total_seconds()
+    seconds = int(diff.total_seconds())
     
-    if seconds < 60:
+    bucket = bisect_right(_TIME_AGO_BOUNDS, seconds)
+    if not bucket:
         return "just now"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 2592000:  # 30 days
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    elif seconds < 31536000:  # 365 days
-        months = int(seconds / 2592000)
-        return f"{months} month{'s' if months != 1 else ''} ago"
-    else:
-        years = int(seconds / 31536000)
-        return f"{years} year{'s' if years != 1 else ''} ago"
+    
+    unit, unit_seconds = _TIME_AGO_UNITS[bucket]
+    count = seconds // unit_seconds
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
 
 def truncate_text(text, length=100):
     """Truncate text to specified length"""
@@ -120,9 +135,10 @@ def truncate_text(text, length=100):
         return text
     return text[:length] + "..."
 
+@lru_cache(maxsize=4096)
 def generate_order_number(order_id):
     """Generate human readable order number"""
-    return f"BMB{order_id:06d}"
+    return 'BMB%06d' % order_id
 
 def parse_location_string(location):
     """Parse location string into components"""
@@ -142,8 +158,33 @@ def parse_location_string(location):
     
     return {'address': location.strip()}
 
+# Shared pool for parallel Cloudinary uploads (network-bound, so threads overlap the round-trips).
+# Created on first use so importing helpers doesn't start threads in every process.
+CLOUDINARY_WORKERS = int(os.environ.get('CLOUDINARY_WORKERS', 8))
+_cloudinary_executor = None
+_cloudinary_executor_lock = threading.Lock()
+
+def _get_cloudinary_executor():
+    """Get the shared Cloudinary upload pool, creating it on first use"""
+    global _cloudinary_executor
+    
+    if _cloudinary_executor is None:
+        with _cloudinary_executor_lock:
+            if _cloudinary_executor is None:
+                executor = ThreadPoolExecutor(max_workers=CLOUDINARY_WORKERS, thread_name_prefix='cloudinary')
+                atexit.register(executor.shutdown)
+                _cloudinary_executor = executor
+    
+    return _cloudinary_executor
+
+# Folder listings rarely change between adjacent requests: (folder, max_results) -> (expires_at, resources)
+CLOUDINARY_RESOURCES_TTL = 60  # seconds
+_resources_cache = {}
+
 def upload_to_cloudinary(file, folder, public_id=None, transformation=None):
     """Upload file to Cloudinary"""
+    import cloudinary.uploader  # deferred: only upload paths need the SDK
+    
     try:
         if not file or not file.filename:
             return None
@@ -161,6 +202,7 @@ def upload_to_cloudinary(file, folder, public_id=None, transformation=None):
             upload_kwargs['transformation'] = transformation
         
         result = cloudinary.uploader.upload(file, **upload_kwargs)
+        _resources_cache.clear()
         
         return {
             'url': result['secure_url'],
@@ -170,32 +212,51 @@ def upload_to_cloudinary(file, folder, public_id=None, transformation=None):
             'height': result['height']
         }
     except Exception as e:
-        logger.error(f"Cloudinary upload error: {e}")
+        logger.error("Cloudinary upload error: %s", e)
         return None
 
 def delete_from_cloudinary(public_id):
     """Delete file from Cloudinary"""
+    import cloudinary.uploader
+    
     try:
         if not public_id:
             return False
         
         result = cloudinary.uploader.destroy(public_id)
+        _resources_cache.clear()
         return result.get('result') == 'ok'
     except Exception as e:
-        logger.error(f"Cloudinary delete error: {e}")
+        logger.error("Cloudinary delete error: %s", e)
         return False
 
+def upload_many_to_cloudinary(files, folder, transformation=None):
+    """Upload several files to Cloudinary in parallel; results keep the input order"""
+    return list(_get_cloudinary_executor().map(
+        lambda file: upload_to_cloudinary(file, folder, transformation=transformation),
+        files
+    ))
+
 def get_cloudinary_resources(folder, max_results=100):
     """Get resources from Cloudinary folder"""
+    import cloudinary.api
+    
+    key = (folder, max_results)
+    cached = _resources_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    
     try:
         result = cloudinary.api.resources(
             type="upload",
             prefix=folder,
             max_results=max_results
         )
-        return result.get('resources', [])
+        resources = result.get('resources', [])
+        _resources_cache[key] = (time.monotonic() + CLOUDINARY_RESOURCES_TTL, resources)
+        return resources
     except Exception as e:
-        logger.error(f"Cloudinary resources error: {e}")
+        logger.error("Cloudinary resources error: %s", e)
         return []
 
 def calculate_order_stats(orders):
@@ -209,13 +270,20 @@ def calculate_order_stats(orders):
             'delivered_orders': 0
         }
     
+    # Accumulate revenue and status counts in one pass over the orders
+    total_revenue = 0.0
+    pending_orders = delivered_orders = 0
+    for order in orders:
+        total_revenue += float(order.get('total_amount', 0) or 0)
+        status = order.get('status')
+        if status == 'pending':
+            pending_orders += 1
+        elif status == 'delivered':
+            delivered_orders += 1
+    
     total_orders = len(orders)
-    total_revenue = sum(float(order.get('total_amount', 0)) for order in orders)
     avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
     
-    pending_orders = sum(1 for order in orders if order.get('status') == 'pending')
-    delivered_orders = sum(1 for order in orders if order.get('status') == 'delivered')
-    
     return {
         'total_orders': total_orders,
         'total_revenue': total_revenue,
@@ -240,13 +308,11 @@ def get_date_ranges(period='today'):
         end = start + timedelta(days=7)
     elif period == 'month':
         start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        if now.month == 12:
-            end = now.replace(year=now.year+1, month=1, day=1)
-        else:
-            end = now.replace(month=now.month+1, day=1)
+        # Any day 32 days past the 1st is in the next month
+        end = (start + timedelta(days=32)).replace(day=1)
     elif period == 'year':
         start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(year=now.year+1, month=1, day=1)
+        end = start.replace(year=start.year + 1)
     else:
         start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=1)
@@ -254,8 +320,8 @@ def get_date_ranges(period='today'):
     return {
         'start': start,
         'end': end,
-        'start_utc': start.astimezone(pytz.utc),
-        'end_utc': end.astimezone(pytz.utc)
+        'start_utc': start.astimezone(UTC),
+        'end_utc': end.astimezone(UTC)
     }
 
 def generate_pagination(page, total_pages, url_base, params=None):
@@ -272,55 +338,51 @@ def generate_pagination(page, total_pages, url_base, params=None):
         'next_url': None
     }
     
+    # urlencode percent-escapes filter values (search terms, dates) in the links
     if pagination['has_prev']:
-        prev_params = params.copy()
-        prev_params['page'] = page - 1
-        pagination['prev_url'] = f"{url_base}?{'&'.join(f'{k}={v}' for k, v in prev_params.items())}"
+        pagination['prev_url'] = f"{url_base}?{urlencode({**params, 'page': page - 1})}"
     
     if pagination['has_next']:
-        next_params = params.copy()
-        next_params['page'] = page + 1
-        pagination['next_url'] = f"{url_base}?{'&'.join(f'{k}={v}' for k, v in next_params.items())}"
+        pagination['next_url'] = f"{url_base}?{urlencode({**params, 'page': page + 1})}"
     
-    # Calculate page numbers to display
+    # Calculate page numbers to display, building one list in place
     pages = []
     if total_pages <= 7:
-        pages = list(range(1, total_pages + 1))
+        pages.extend(range(1, total_pages + 1))
     else:
         if page <= 4:
-            pages = list(range(1, 6)) + ['...', total_pages]
+            pages.extend(range(1, 6))
+            pages.extend(('...', total_pages))
         elif page >= total_pages - 3:
-            pages = [1, '...'] + list(range(total_pages - 4, total_pages + 1))
+            pages.extend((1, '...'))
+            pages.extend(range(total_pages - 4, total_pages + 1))
         else:
-            pages = [1, '...'] + list(range(page - 2, page + 3)) + ['...', total_pages]
+            pages.extend((1, '...'))
+            pages.extend(range(page - 2, page + 3))
+            pages.extend(('...', total_pages))
     
     pagination['pages'] = pages
     
     return pagination
 
+_BYTE_UNITS = (('B', 1), ('KB', 1024), ('MB', 1024 ** 2), ('GB', 1024 ** 3))
+
 def format_bytes(size_bytes):
     """Format bytes to human readable format"""
-    if size_bytes < 1024:
+    # Each unit is 10 bits wider than the last, so the bit length picks it directly
+    unit = min(max(int(size_bytes).bit_length() - 1, 0) // 10, 3)
+    if not unit:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 ** 2:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 ** 3:
-        return f"{size_bytes / (1024 ** 2):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 ** 3):.1f} GB"
+    name, divisor = _BYTE_UNITS[unit]
+    return f"{size_bytes / divisor:.1f} {name}"
 
 def sanitize_input(text):
     """Sanitize user input"""
     if not text:
         return ""
     
-    import html
-    text = html.escape(text)
-    
-    # Remove potentially dangerous characters
-    dangerous = ['<script>', '</script>', 'javascript:', 'onclick', 'onload', 'onerror']
-    for d in dangerous:
-        text = text.replace(d, '')
+    # Remove potentially dangerous fragments before escaping, while the raw tags are still matchable
+    text = html.escape(_DANGEROUS_INPUT_RE.sub('', text))
     
     return text.strip()
 
@@ -329,16 +391,30 @@ def validate_password(password):
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not any(c.isupper() for c in password):
+    # Record which character classes appear, stopping once all have been seen
+    seen = 0
+    for c in password:
+        if c.isupper():
+            seen |= _PW_UPPER
+        elif c.islower():
+            seen |= _PW_LOWER
+        elif c.isdigit():
+            seen |= _PW_DIGIT
+        elif c in _PASSWORD_SPECIAL_CHARS:
+            seen |= _PW_SPECIAL
+        if seen == _PW_ALL:
+            break
+    
+    if not seen & _PW_UPPER:
         return False, "Password must contain at least one uppercase letter"
     
-    if not any(c.islower() for c in password):
+    if not seen & _PW_LOWER:
         return False, "Password must contain at least one lowercase letter"
     
-    if not any(c.isdigit() for c in password):
+    if not seen & _PW_DIGIT:
         return False, "Password must contain at least one digit"
     
-    if not any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?/' for c in password):
+    if not seen & _PW_SPECIAL:
         return False, "Password must contain at least one special character"
     
     return True, "Password is strong"
@@ -1,15 +1,74 @@
 # dashboard-website/utils/validators.py
+import json
 import re
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 
+try:
+    import orjson
+except ImportError:  # orjson is a speedup; stdlib json has the same loads API
+    import json as orjson
+
+def _loads_json(json_str):
+    """Parse JSON with orjson, retrying with the stdlib for input only it accepts (NaN, 1e400, lone surrogates)"""
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        return json.loads(json_str)
+
+# Compiled once at import; validators run on every form submission
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_PHONE_RE = re.compile(r'^(?:\+91|91|0)?(\d{10})$')
+# Mobile numbers start with 6-9; repeated-digit and sequential fillers are placeholders
+_PHONE_VALID_PREFIXES = frozenset('6789')
+_PHONE_PLACEHOLDERS = frozenset({
+    '6666666666', '7777777777', '8888888888', '9999999999',
+    '0000000000', '1234567890', '9876543210'
+})
+# URL host (letters, digits, -_. or %XX escapes) with an optional port, then /-separated path segments
+_URL_NETLOC_RE = re.compile(r'(?:[-\w.]|%[\da-fA-F]{2})+(?::(\d{1,5}))?\Z')
+_URL_PATH_RE = re.compile(r'(?:/[-\w.%?=&]*)*\Z')
+_NAME_RE = re.compile(r'^[a-zA-Z\s\.\'-]+$')
+_PINCODE_RE = re.compile(r'^[1-9][0-9]{5}$')
+
+# Allowed values for the status-style validators, with their error messages prebuilt
+def _allowed_values(*values):
+    """Freeze allowed values and build the matching error message once"""
+    allowed = frozenset(values)
+    return allowed, f"Invalid status. Allowed: {', '.join(sorted(allowed))}"
+
+_DEFAULT_STATUSES, _DEFAULT_STATUSES_MSG = _allowed_values('active', 'inactive', 'pending', 'approved', 'rejected')
+_ORDER_STATUSES, _ORDER_STATUSES_MSG = _allowed_values('pending', 'confirmed', 'processing', 'out_for_delivery', 'delivered', 'cancelled')
+_PAYMENT_MODES, _PAYMENT_MODES_MSG = _allowed_values('cod', 'online', 'card', 'wallet', 'upi')
+_PAYMENT_STATUSES, _PAYMENT_STATUSES_MSG = _allowed_values('pending', 'completed', 'failed', 'refunded', 'cancelled')
+_ITEM_TYPES, _ITEM_TYPES_MSG = _allowed_values('service', 'menu')
+_NOTIFICATION_TYPES, _NOTIFICATION_TYPES_MSG = _allowed_values('order_update', 'payment', 'system', 'promotion', 'alert')
+_USER_ROLES, _USER_ROLES_MSG = _allowed_values('admin', 'user', 'manager', 'superadmin')
+
+# Upper bound for monetary amounts (10 million)
+_MAX_AMOUNT = 10000000
+_MAX_AMOUNT_DECIMAL = Decimal(_MAX_AMOUNT)
+
+# Password character classes, tracked as bits in a single pass
+_PW_UPPER, _PW_LOWER, _PW_DIGIT, _PW_SPECIAL = 1, 2, 4, 8
+_PW_ALL = _PW_UPPER | _PW_LOWER | _PW_DIGIT | _PW_SPECIAL
+_PASSWORD_SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{};\':"\\|,.<>/?')
+
+# Default upload extensions, with a precompiled check for the common allowed case
+_DEFAULT_ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'pdf', 'doc', 'docx'})
+# Built from the set above so the fast path can't drift from it
+_DEFAULT_EXTENSION_RE = re.compile(
+    r'\.(?:%s)\Z' % '|'.join(map(re.escape, sorted(_DEFAULT_ALLOWED_EXTENSIONS))),
+    re.IGNORECASE
+)
+
 def validate_email(email):
     """Validate email address format"""
     if not email:
         return False, "Email is required"
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.match(email):
         return False, "Invalid email format"
     
     return True, "Email is valid"
@@ -20,29 +79,31 @@ def validate_phone(phone):
         return False, "Phone number is required"
     
     # Remove any non-digit characters except +
-    cleaned = re.sub(r'[^\d+]', '', str(phone))
+    cleaned = _PHONE_STRIP_RE.sub('', str(phone))
     
-    # Check for valid Indian phone numbers
-    pattern = r'^(\+91|91|0)?[6789]\d{9}$'
-    if not re.match(pattern, cleaned):
+    # Check for valid Indian phone numbers, then the 10-digit number itself
+    match = _PHONE_RE.match(cleaned)
+    number = match.group(1) if match else ''
+    if number[:1] not in _PHONE_VALID_PREFIXES or number in _PHONE_PLACEHOLDERS:
         return False, "Invalid phone number format"
     
     return True, "Phone number is valid"
 
 def validate_name(name):
     """Validate person name"""
-    if not name or not name.strip():
+    stripped = name.strip() if name else ''
+    if not stripped:
         return False, "Name is required"
     
-    if len(name.strip()) < 2:
+    length = len(stripped)
+    if length < 2:
         return False, "Name must be at least 2 characters long"
     
-    if len(name.strip()) > 100:
+    if length > 100:
         return False, "Name must be less than 100 characters"
     
     # Allow only letters, spaces, and common name characters
-    pattern = r'^[a-zA-Z\s\.\'-]+$'
-    if not re.match(pattern, name):
+    if not _NAME_RE.match(stripped):
         return False, "Name contains invalid characters"
     
     return True, "Name is valid"
@@ -55,16 +116,30 @@ def validate_password(password):
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not re.search(r'[A-Z]', password):
+    # Record which character classes appear, stopping once all have been seen
+    seen = 0
+    for c in password:
+        if 'A' <= c <= 'Z':
+            seen |= _PW_UPPER
+        elif 'a' <= c <= 'z':
+            seen |= _PW_LOWER
+        elif c.isdecimal():
+            seen |= _PW_DIGIT
+        elif c in _PASSWORD_SPECIAL_CHARS:
+            seen |= _PW_SPECIAL
+        if seen == _PW_ALL:
+            break
+    
+    if not seen & _PW_UPPER:
         return False, "Password must contain at least one uppercase letter"
     
-    if not re.search(r'[a-z]', password):
+    if not seen & _PW_LOWER:
         return False, "Password must contain at least one lowercase letter"
     
-    if not re.search(r'\d', password):
+    if not seen & _PW_DIGIT:
         return False, "Password must contain at least one digit"
     
-    if not re.search(r'[!@#$%^&*()_+\-=\[\]{};\':"\\|,.<>/?]', password):
+    if not seen & _PW_SPECIAL:
         return False, "Password must contain at least one special character"
     
     return True, "Password is strong"
@@ -74,12 +149,25 @@ def validate_amount(amount):
     if amount is None:
         return False, "Amount is required"
     
+    # Plain numbers compare directly; only strings and other types go through Decimal parsing
+    if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+        if amount != amount:  # NaN
+            return False, "Invalid amount format"
+        
+        if amount < 0:
+            return False, "Amount cannot be negative"
+        
+        if amount > _MAX_AMOUNT:
+            return False, "Amount is too large"
+        
+        return True, "Amount is valid"
+    
     try:
-        amount_decimal = Decimal(str(amount))
+        amount_decimal = amount if isinstance(amount, Decimal) else Decimal(str(amount))
         if amount_decimal < 0:
             return False, "Amount cannot be negative"
         
-        if amount_decimal > Decimal('10000000'):  # 10 million limit
+        if amount_decimal > _MAX_AMOUNT_DECIMAL:
             return False, "Amount is too large"
         
         return True, "Amount is valid"
@@ -109,7 +197,11 @@ def validate_date(date_str, date_format='%Y-%m-%d'):
         return False, "Date is required"
     
     try:
-        datetime.strptime(date_str, date_format)
+        # Fast path for zero-padded ISO dates; anything else keeps strptime's exact rules
+        if date_format == '%Y-%m-%d' and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+            date.fromisoformat(date_str)
+        else:
+            datetime.strptime(date_str, date_format)
         return True, "Date is valid"
     except ValueError:
         return False, f"Invalid date format. Expected: {date_format}"
@@ -119,21 +211,22 @@ def validate_pincode(pincode):
     if not pincode:
         return False, "Pincode is required"
     
-    pattern = r'^[1-9][0-9]{5}$'
-    if not re.match(pattern, str(pincode)):
+    if not _PINCODE_RE.match(str(pincode)):
         return False, "Invalid pincode format (6 digits required)"
     
     return True, "Pincode is valid"
 
 def validate_address(address):
     """Validate address"""
-    if not address or not address.strip():
+    stripped = address.strip() if address else ''
+    if not stripped:
         return False, "Address is required"
     
-    if len(address.strip()) < 10:
+    length = len(stripped)
+    if length < 10:
         return False, "Address must be at least 10 characters long"
     
-    if len(address.strip()) > 500:
+    if length > 500:
         return False, "Address is too long (max 500 characters)"
     
     return True, "Address is valid"
@@ -162,8 +255,14 @@ def validate_url(url):
     if not url:
         return False, "URL is required"
     
-    pattern = r'^https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w.%?=&]*)*$'
-    if not re.match(pattern, url):
+    # Split host from path once, then check each with a small anchored pattern
+    if not url.startswith(('http://', 'https://')):
+        return False, "Invalid URL format"
+    
+    netloc, slash, path = url.split('://', 1)[1].partition('/')
+    host = _URL_NETLOC_RE.match(netloc)
+    port = host and host.group(1)
+    if not host or (port and not 0 < int(port) <= 65535) or not _URL_PATH_RE.match(slash + path):
         return False, "Invalid URL format"
     
     return True, "URL is valid"
@@ -174,7 +273,9 @@ def validate_file_extension(filename, allowed_extensions=None):
         return False, "Filename is required"
     
     if allowed_extensions is None:
-        allowed_extensions = {'png', 'jpg', 'jpeg', 'gif', 'pdf', 'doc', 'docx'}
+        if _DEFAULT_EXTENSION_RE.search(filename):
+            return True, "File extension is valid"
+        allowed_extensions = _DEFAULT_ALLOWED_EXTENSIONS
     
     extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
     
@@ -201,8 +302,7 @@ def validate_json(json_str):
         return False, "JSON is required"
     
     try:
-        import json
-        json.loads(json_str)
+        _loads_json(json_str)
         return True, "JSON is valid"
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON: {str(e)}"
@@ -229,10 +329,16 @@ def validate_discount(discount):
     """Validate discount percentage"""
     return validate_range(discount, 0, 100)
 
+def _check_allowed(value, allowed, message):
+    """Validate value against a frozen allowed set with a prebuilt error message"""
+    if value in allowed:
+        return True, "Status is valid"
+    return False, message
+
 def validate_status(status, allowed_statuses=None):
     """Validate status value"""
     if allowed_statuses is None:
-        allowed_statuses = {'active', 'inactive', 'pending', 'approved', 'rejected'}
+        return _check_allowed(status, _DEFAULT_STATUSES, _DEFAULT_STATUSES_MSG)
     
     if status not in allowed_statuses:
         return False, f"Invalid status. Allowed: {', '.join(allowed_statuses)}"
@@ -254,43 +360,38 @@ def validate_description(description, min_length=10, max_length=2000):
     if not description:
         return False, "Description is required"
     
-    if len(description) < min_length:
+    length = len(description)
+    if length < min_length:
         return False, f"Description must be at least {min_length} characters long"
     
-    if len(description) > max_length:
+    if length > max_length:
         return False, f"Description must be less than {max_length} characters"
     
     return True, "Description is valid"
 
 def validate_order_status(status):
     """Validate order status"""
-    allowed_statuses = {'pending', 'confirmed', 'processing', 'out_for_delivery', 'delivered', 'cancelled'}
-    return validate_status(status, allowed_statuses)
+    return _check_allowed(status, _ORDER_STATUSES, _ORDER_STATUSES_MSG)
 
 def validate_payment_mode(mode):
     """Validate payment mode"""
-    allowed_modes = {'cod', 'online', 'card', 'wallet', 'upi'}
-    return validate_status(mode, allowed_modes)
+    return _check_allowed(mode, _PAYMENT_MODES, _PAYMENT_MODES_MSG)
 
 def validate_payment_status(status):
     """Validate payment status"""
-    allowed_statuses = {'pending', 'completed', 'failed', 'refunded', 'cancelled'}
-    return validate_status(status, allowed_statuses)
+    return _check_allowed(status, _PAYMENT_STATUSES, _PAYMENT_STATUSES_MSG)
 
 def validate_item_type(item_type):
     """Validate item type"""
-    allowed_types = {'service', 'menu'}
-    return validate_status(item_type, allowed_types)
+    return _check_allowed(item_type, _ITEM_TYPES, _ITEM_TYPES_MSG)
 
 def validate_notification_type(notification_type):
     """Validate notification type"""
-    allowed_types = {'order_update', 'payment', 'system', 'promotion', 'alert'}
-    return validate_status(notification_type, allowed_types)
+    return _check_allowed(notification_type, _NOTIFICATION_TYPES, _NOTIFICATION_TYPES_MSG)
 
 def validate_user_role(role):
     """Validate user role"""
-    allowed_roles = {'admin', 'user', 'manager', 'superadmin'}
-    return validate_status(role, allowed_roles)
+    return _check_allowed(role, _USER_ROLES, _USER_ROLES_MSG)
 
 def validate_service_category(category):
     """Validate service category"""